@@ -6,7 +6,7 @@ from cx_Freeze import setup, Executable
 build_exe_options = {
     "packages": ["PySide6", "winreg", "psutil", "ctypes"],
     "excludes": ["tkinter", "matplotlib"],
-    "include_files": [],
+    "include_files": [("resources/main.qss", "resources/main.qss")],
     "optimize": 2,
 }
 
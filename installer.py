@@ -47,6 +47,7 @@ class SystemToolsInstaller:
             "registry_manager.py",
             "admin_utils.py",
             "ui_styles.py",
+            "resources/main.qss",
             "requirements.txt"
         ]
         
@@ -54,6 +55,7 @@ class SystemToolsInstaller:
             src = current_dir / file_name
             dst = self.install_dir / file_name
             if src.exists():
+                dst.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(src, dst)
                 print(f"Copied {file_name}")
     
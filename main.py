@@ -19,6 +19,7 @@ from network_tools import NetworkToolsManager
 from firewall_gui import FirewallStatusWidget, FirewallRulesWidget, FirewallMonitorWidget
 from cleanup_gui import CleanupLocationWidget, CleanupSchedulerWidget
 from services_gui import ServicesStatusWidget, ServiceConfigWidget
+from services_manager import ServicesManager
 from event_log_gui import EventLogViewerWidget, EventLogQuickActionsWidget
 from system_info_gui import SystemInfoTabWidget
 from log_export_manager import LogExportManager, add_export_button_to_layout
@@ -480,12 +481,15 @@ class SystemMaintenanceApp(QMainWindow):
         # Create services sub-tabs
         services_tabs = QTabWidget()
         
+        # Both service tabs share one manager so they share its services snapshot
+        self.services_manager = ServicesManager()
+        
         # Services status and control tab
-        self.services_status_widget = ServicesStatusWidget()
+        self.services_status_widget = ServicesStatusWidget(self.services_manager)
         services_tabs.addTab(self.services_status_widget, "Service Control")
         
         # Service configuration tab
-        self.service_config_widget = ServiceConfigWidget()
+        self.service_config_widget = ServiceConfigWidget(self.services_manager)
         services_tabs.addTab(self.service_config_widget, "Startup Configuration")
         
         layout.addWidget(services_tabs)
@@ -551,6 +555,12 @@ class SystemMaintenanceApp(QMainWindow):
     def apply_styles(self):
         self.setStyleSheet(UIStyles.get_stylesheet())
     
+    def closeEvent(self, event):
+        # Child widgets get no close event, so stop background work here
+        self.system_info_widget.stop_monitoring()
+        self.services_status_widget.wait_for_restart()
+        super().closeEvent(event)
+    
     # SFC Commands
     def run_sfc(self):
         if not self.admin_utils.is_admin():
@@ -1,25 +1,239 @@
 import sys
-from typing import Dict, Optional
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                               QTableWidgetItem, QPushButton, QLabel, QTextEdit,
+from typing import Dict, List, Optional
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                               QPushButton, QLabel, QTextEdit,
                                QGroupBox, QComboBox, QMessageBox, QHeaderView,
                                QAbstractItemView, QSplitter, QFrame, QScrollArea,
                                QSizePolicy)
-from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QColor, QFont
+from PySide6.QtCore import Qt, QTimer, QSize, QAbstractTableModel, QModelIndex, QSignalBlocker
+from PySide6.QtGui import QColor, QFont, QTextCursor
 
-from services_manager import ServicesManager, ServiceInfo, ServiceStatus, ServiceStartType, ServiceMonitorThread
+from services_manager import (ServicesManager, ServiceInfo, ServiceStatus, ServiceStartType,
+                              ServiceMonitorThread, ServiceListThread, ServiceRestartThread,
+                             sort_services_by_display_name)
 from admin_utils import AdminUtils
 
+WINDOWS_UPDATE_SERVICES = frozenset(['wuauserv', 'bits', 'cryptsvc', 'msiserver', 'trustedinstaller'])
+NETWORK_SERVICES = frozenset(['lanmanserver', 'lanmanworkstation', 'dnscache', 'dhcp', 'netlogon', 'netman', 'nsi'])
+SECURITY_SERVICES = frozenset(['mpssvc', 'windefend', 'wscsvc', 'wersvc'])
+
+# Filter combo text -> row predicate; "All Services" has no predicate
+SERVICE_FILTERS = {
+    "Running Only": lambda info: info.status == ServiceStatus.RUNNING,
+    "Stopped Only": lambda info: info.status == ServiceStatus.STOPPED,
+    "Windows Update": lambda info: info.name_lower in WINDOWS_UPDATE_SERVICES,
+    "Network Services": lambda info: info.name_lower in NETWORK_SERVICES,
+    "Security Services": lambda info: info.name_lower in SECURITY_SERVICES,
+}
+
+class ServicesTableModel(QAbstractTableModel):
+    """Table model exposing ServiceInfo rows to a QTableView.
+    
+    The view only asks for the cells intersecting its viewport, so cell text
+    is produced on demand in data() instead of being realized up-front.
+    """
+    
+    HEADERS = ["Service Name", "Display Name", "Status", "Startup", "PID", "Description"]
+    
+    # Tooltips for enum-valued columns are shared by every row
+    STATUS_TOOLTIPS = {status: f"Status: {status.value}" for status in ServiceStatus}
+    STARTUP_TOOLTIPS = {start_type: f"Startup Type: {start_type.value}" for start_type in ServiceStartType}
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._services: List[ServiceInfo] = []
+        self._row_by_name: Dict[str, int] = {}
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._services)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        service_info = self._services[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display_text(service_info, column)
+        elif role == Qt.ItemDataRole.UserRole:
+            return service_info.name
+        elif role == Qt.ItemDataRole.ForegroundRole and column == 2:
+            return self.get_status_color(service_info.status)
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column == 4 and service_info.pid:
+            return Qt.AlignmentFlag.AlignCenter
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            return self._tooltip_text(service_info, column)
+        
+        return None
+    
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort rows by the display text of a column"""
+        self._sort_column = column
+        self._sort_order = order
+        
+        self._relayout()
+    
+    def set_services(self, services: List[ServiceInfo]):
+        """Update the model rows in place from a new list of services
+        
+        Existing rows are reused: only rows whose service changed are
+        reported through dataChanged, and rows are inserted or removed
+        only for services entering or leaving the list.
+        """
+        services = list(services)
+        new_by_name = {info.name: info for info in services}
+        
+        # Remove rows bottom-up so the remaining row numbers stay valid
+        removed_rows = sorted((row for name, row in self._row_by_name.items() if name not in new_by_name),
+                              reverse=True)
+        for row in removed_rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._services[row]
+            self.endRemoveRows()
+        
+        # Update surviving rows in place
+        changed = False
+        last_column = len(self.HEADERS) - 1
+        for row, old_info in enumerate(self._services):
+            new_info = new_by_name[old_info.name]
+            if new_info != old_info:
+                self._services[row] = new_info
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+                changed = True
+        
+        # Append rows for services that were not shown before
+        shown = {info.name for info in self._services}
+        added = [info for info in services if info.name not in shown]
+        if added:
+            first = len(self._services)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._services.extend(added)
+            self.endInsertRows()
+        
+        if self._sort_column >= 0 and (removed_rows or added or changed):
+            self._relayout()
+        else:
+            self._index_rows()
+    
+    def service_at(self, row: int) -> Optional[ServiceInfo]:
+        """Get the service shown at a row"""
+        if 0 <= row < len(self._services):
+            return self._services[row]
+        return None
+    
+    def row_of(self, service_name: str) -> int:
+        """Get the row of a service, or -1 if it is not shown"""
+        return self._row_by_name.get(service_name, -1)
+    
+    def _relayout(self):
+        """Re-apply the current sort, keeping persistent indexes (selection) attached to their service"""
+        self.layoutAboutToBeChanged.emit()
+        
+        old_indexes = self.persistentIndexList()
+        old_names = [self._services[index.row()].name for index in old_indexes]
+        
+        if self._sort_column >= 0:
+            column = self._sort_column
+            self._services.sort(
+                key=lambda info: self._display_text(info, column),
+                reverse=self._sort_order == Qt.SortOrder.DescendingOrder
+            )
+        self._index_rows()
+        
+        new_indexes = [self.index(self._row_by_name[name], index.column())
+                       for name, index in zip(old_names, old_indexes)]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        
+        self.layoutChanged.emit()
+    
+    def _index_rows(self):
+        self._row_by_name = {info.name: row for row, info in enumerate(self._services)}
+    
+    @staticmethod
+    def _display_text(service_info: ServiceInfo, column: int) -> str:
+        if column == 0:
+            return service_info.name
+        elif column == 1:
+            return service_info.display_name or service_info.name
+        elif column == 2:
+            return service_info.status.value
+        elif column == 3:
+            return service_info.start_type.value
+        elif column == 4:
+            return str(service_info.pid) if service_info.pid else "-"
+        return service_info.description or "No description available"
+    
+    @classmethod
+    def _tooltip_text(cls, service_info: ServiceInfo, column: int) -> str:
+        # Only called when the hover timer fires on a cell, so nothing is
+        # stored per row up-front
+        if column == 0:
+            return f"Service Name: {service_info.name}"
+        elif column == 2:
+            return cls.STATUS_TOOLTIPS[service_info.status]
+        elif column == 3:
+            return cls.STARTUP_TOOLTIPS[service_info.start_type]
+        elif column == 4:
+            return f"Process ID: {cls._display_text(service_info, column)}"
+        return cls._display_text(service_info, column)
+    
+    @staticmethod
+    def get_status_color(status: ServiceStatus) -> QColor:
+        """Get color for service status"""
+        if status == ServiceStatus.RUNNING:
+            return QColor(39, 174, 96)  # Green
+        elif status == ServiceStatus.STOPPED:
+            return QColor(231, 76, 60)  # Red
+        elif status in [ServiceStatus.START_PENDING, ServiceStatus.STOP_PENDING]:
+            return QColor(243, 156, 18)  # Orange
+        else:
+            return QColor(149, 165, 166)  # Gray
+
+class ServicesTableView(QTableView):
+    """Table view that never scans a whole column to size it"""
+    
+    COLUMN_WIDTHS = [120, 200, 80, 80, 60, 200]
+    
+    def sizeHintForColumn(self, column: int) -> int:
+        # The default implementation asks the model for every row
+        return self.COLUMN_WIDTHS[column]
+
 class ServicesStatusWidget(QWidget):
     """Widget for displaying and managing Windows services"""
     
-    def __init__(self):
+    def __init__(self, services_manager: Optional[ServicesManager] = None):
         super().__init__()
-        self.services_manager = ServicesManager()
+        self.services_manager = services_manager or ServicesManager()
         self.admin_utils = AdminUtils()
         self.monitor_thread = None
+        self.restart_thread = None
         self.current_services = {}
+        self._running_count = 0
+        self._last_signature = None
+        self._selection_dirty = False
+        
+        # Single refresh timer so bursts of completed operations only refresh once
+        self._pending_refresh_timer = QTimer(self)
+        self._pending_refresh_timer.setSingleShot(True)
+        self._pending_refresh_timer.timeout.connect(self.refresh_services)
+        
+        # Log lines are buffered and written to the log at most every 100 ms
+        self._log_buffer: List[str] = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self.flush_log)
         
         self.setup_ui()
         self.setup_connections()
@@ -113,7 +327,9 @@ class ServicesStatusWidget(QWidget):
         layout.setContentsMargins(10, 15, 10, 10)
         
         # Services table
-        self.services_table = QTableWidget()
+        self.services_model = ServicesTableModel(self)
+        self.services_table = ServicesTableView()
+        self.services_table.setModel(self.services_model)
         self.setup_services_table()
         layout.addWidget(self.services_table)
         
@@ -162,6 +378,7 @@ class ServicesStatusWidget(QWidget):
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(150)
         self.output_text.setMaximumHeight(250)
+        self.output_text.document().setMaximumBlockCount(1000)
         self.output_text.setPlainText("Service management ready...\n")
         layout.addWidget(self.output_text)
         
@@ -177,11 +394,7 @@ class ServicesStatusWidget(QWidget):
         return container
     
     def setup_services_table(self):
-        """Setup the services table widget"""
-        headers = ["Service Name", "Display Name", "Status", "Startup", "PID", "Description"]
-        self.services_table.setColumnCount(len(headers))
-        self.services_table.setHorizontalHeaderLabels(headers)
-        
+        """Setup the services table view"""
         # Configure table
         self.services_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.services_table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -213,11 +426,12 @@ class ServicesStatusWidget(QWidget):
         self.services_table.verticalHeader().setVisible(False)
         
         # Connect selection change
-        self.services_table.itemSelectionChanged.connect(self.on_service_selection_changed)
+        self.services_table.selectionModel().selectionChanged.connect(self.on_service_selection_changed)
     
     def setup_connections(self):
         """Setup signal connections"""
         self.services_manager.operation_completed.connect(self.on_operation_completed)
+        self.services_manager.log_line.connect(self.on_log_line, Qt.ConnectionType.QueuedConnection)
     
     def start_monitoring(self):
         """Start the service monitoring thread"""
@@ -234,64 +448,41 @@ class ServicesStatusWidget(QWidget):
     
     def update_services_display(self, services: Dict[str, ServiceInfo]):
         """Update the services table with new data"""
+        if services is not self.current_services:
+            self._update_running_count(self.current_services, services)
         self.current_services = services
         
+        # Skip the repaint entirely when neither the snapshot nor the filter changed
+        signature = self._snapshot_signature(services)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        
         # Store current selection
         current_selection = self.get_selected_service()
         
-        # Clear existing rows
-        self.services_table.setRowCount(0)
-        
         # Apply current filter
         filtered_services = self.get_filtered_services(services)
         
-        # Populate table
-        self.services_table.setRowCount(len(filtered_services))
-        
-        for row, (service_name, service_info) in enumerate(filtered_services.items()):
-            # Service Name
-            name_item = QTableWidgetItem(service_name)
-            name_item.setData(Qt.ItemDataRole.UserRole, service_name)
-            name_item.setToolTip(f"Service Name: {service_name}")
-            self.services_table.setItem(row, 0, name_item)
-            
-            # Display Name
-            display_item = QTableWidgetItem(service_info.display_name or service_name)
-            display_item.setToolTip(service_info.display_name or service_name)
-            self.services_table.setItem(row, 1, display_item)
-            
-            # Status
-            status_item = QTableWidgetItem(service_info.status.value)
-            status_color = self.get_status_color(service_info.status)
-            status_item.setForeground(status_color)
-            status_item.setToolTip(f"Status: {service_info.status.value}")
-            self.services_table.setItem(row, 2, status_item)
-            
-            # Startup Type
-            startup_item = QTableWidgetItem(service_info.start_type.value)
-            startup_item.setToolTip(f"Startup Type: {service_info.start_type.value}")
-            self.services_table.setItem(row, 3, startup_item)
-            
-            # PID
-            pid_text = str(service_info.pid) if service_info.pid else "-"
-            pid_item = QTableWidgetItem(pid_text)
-            pid_item.setToolTip(f"Process ID: {pid_text}")
-            if service_info.pid:
-                pid_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.services_table.setItem(row, 4, pid_item)
+        # The model reuses its rows and only notifies the ones that changed;
+        # the view then repaints just the affected rows in its viewport.
+        # Selection signals are held so row removal and re-sorting don't
+        # run the selection handler against a half-updated model.
+        blocker = QSignalBlocker(self.services_table.selectionModel())
+        try:
+            self.services_model.set_services(filtered_services.values())
             
-            # Description
-            description = service_info.description or "No description available"
-            desc_item = QTableWidgetItem(description)
-            desc_item.setToolTip(description)
-            self.services_table.setItem(row, 5, desc_item)
+            # Restore selection if possible
+            if current_selection:
+                self.select_service_by_name(current_selection)
+        finally:
+            blocker.unblock()
         
-        # Restore selection if possible
-        if current_selection:
-            self.select_service_by_name(current_selection)
+        # Refresh the action buttons once for the (possibly changed) selected service
+        self.on_service_selection_changed()
         
         # Update status
-        running_count = sum(1 for s in services.values() if s.status == ServiceStatus.RUNNING)
+        running_count = self._running_count
         total_count = len(services)
         filtered_count = len(filtered_services)
         
@@ -300,46 +491,38 @@ class ServicesStatusWidget(QWidget):
         else:
             self.status_label.setText(f"Services: {running_count}/{total_count} running")
     
+    def _snapshot_signature(self, services: Dict[str, ServiceInfo]) -> tuple:
+        """Build a comparable signature of what the table would display"""
+        return (
+            self.filter_combo.currentText(),
+            frozenset((name, info.status, info.start_type, info.pid) for name, info in services.items())
+        )
+    
+    def _update_running_count(self, previous: Dict[str, ServiceInfo], services: Dict[str, ServiceInfo]):
+        """Adjust the running counter by the delta between two snapshots"""
+        for service_name in previous.keys() - services.keys():
+            if previous[service_name].status == ServiceStatus.RUNNING:
+                self._running_count -= 1
+        
+        for service_name, service_info in services.items():
+            old_info = previous.get(service_name)
+            was_running = old_info is not None and old_info.status == ServiceStatus.RUNNING
+            is_running = service_info.status == ServiceStatus.RUNNING
+            if is_running != was_running:
+                self._running_count += 1 if is_running else -1
+    
     def select_service_by_name(self, service_name: str):
         """Select a service by name in the table"""
-        for row in range(self.services_table.rowCount()):
-            item = self.services_table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) == service_name:
-                self.services_table.selectRow(row)
-                break
+        row = self.services_model.row_of(service_name)
+        if row >= 0:
+            self.services_table.selectRow(row)
     
     def get_filtered_services(self, services: Dict[str, ServiceInfo]) -> Dict[str, ServiceInfo]:
         """Apply current filter to services"""
-        filter_text = self.filter_combo.currentText()
-        
-        if filter_text == "All Services":
+        predicate = SERVICE_FILTERS.get(self.filter_combo.currentText())
+        if predicate is None:
             return services
-        elif filter_text == "Running Only":
-            return {k: v for k, v in services.items() if v.status == ServiceStatus.RUNNING}
-        elif filter_text == "Stopped Only":
-            return {k: v for k, v in services.items() if v.status == ServiceStatus.STOPPED}
-        elif filter_text == "Windows Update":
-            update_services = ['wuauserv', 'bits', 'cryptsvc', 'msiserver', 'trustedinstaller']
-            return {k: v for k, v in services.items() if k.lower() in update_services}
-        elif filter_text == "Network Services":
-            network_services = ['lanmanserver', 'lanmanworkstation', 'dnscache', 'dhcp', 'netlogon', 'netman', 'nsi']
-            return {k: v for k, v in services.items() if k.lower() in network_services}
-        elif filter_text == "Security Services":
-            security_services = ['mpssvc', 'windefend', 'wscsvc', 'wersvc']
-            return {k: v for k, v in services.items() if k.lower() in security_services}
-        
-        return services
-    
-    def get_status_color(self, status: ServiceStatus) -> QColor:
-        """Get color for service status"""
-        if status == ServiceStatus.RUNNING:
-            return QColor(39, 174, 96)  # Green
-        elif status == ServiceStatus.STOPPED:
-            return QColor(231, 76, 60)  # Red
-        elif status in [ServiceStatus.START_PENDING, ServiceStatus.STOP_PENDING]:
-            return QColor(243, 156, 18)  # Orange
-        else:
-            return QColor(149, 165, 166)  # Gray
+        return {k: v for k, v in services.items() if predicate(v)}
     
     def apply_filter(self):
         """Apply the selected filter"""
@@ -348,11 +531,11 @@ class ServicesStatusWidget(QWidget):
     
     def refresh_services(self):
         """Manually refresh services"""
-        self.output_text.append("Refreshing services...")
+        self.append_log("Refreshing services...")
         if self.monitor_thread and self.monitor_thread.isRunning():
-            # Force an immediate update
-            services = self.services_manager.get_all_important_services()
-            self.update_services_display(services)
+            # Let the monitor thread poll now; its services_updated signal
+            # drives the display update without blocking the UI thread
+            self.monitor_thread.request_immediate_poll()
     
     def toggle_auto_refresh(self):
         """Toggle auto-refresh monitoring"""
@@ -364,11 +547,18 @@ class ServicesStatusWidget(QWidget):
             self.stop_monitoring()
     
     def on_service_selection_changed(self):
-        """Handle service selection change"""
-        selected_items = self.services_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            service_name = self.services_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        """Handle service selection change, coalesced to once per event loop turn"""
+        if self._selection_dirty:
+            return
+        self._selection_dirty = True
+        QTimer.singleShot(0, self._apply_selection_change)
+    
+    def _apply_selection_change(self):
+        """Update the selection label and action buttons for the current selection"""
+        self._selection_dirty = False
+        
+        service_name = self.get_selected_service()
+        if service_name:
             service_info = self.current_services.get(service_name)
             
             if service_info:
@@ -382,7 +572,7 @@ class ServicesStatusWidget(QWidget):
                 
                 self.start_btn.setEnabled(is_stopped)
                 self.stop_btn.setEnabled(is_running and service_info.can_stop)
-                self.restart_btn.setEnabled(is_running)
+                self.restart_btn.setEnabled(is_running and self.restart_thread is None)
         else:
             # No selection
             self.selection_label.setText("Select a service to manage")
@@ -393,10 +583,9 @@ class ServicesStatusWidget(QWidget):
     
     def get_selected_service(self) -> Optional[str]:
         """Get the currently selected service name"""
-        selected_items = self.services_table.selectedItems()
-        if selected_items:
-            row = selected_items[0].row()
-            return self.services_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        selected_rows = self.services_table.selectionModel().selectedRows()
+        if selected_rows:
+            return selected_rows[0].data(Qt.ItemDataRole.UserRole)
         return None
     
     def start_selected_service(self):
@@ -418,7 +607,7 @@ class ServicesStatusWidget(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.services_manager.start_service(service_name, self.output_text)
+                self.services_manager.start_service(service_name)
     
     def stop_selected_service(self):
         """Stop the selected service"""
@@ -440,12 +629,12 @@ class ServicesStatusWidget(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.services_manager.stop_service(service_name, self.output_text)
+                self.services_manager.stop_service(service_name)
     
     def restart_selected_service(self):
-        """Restart the selected service"""
+        """Restart the selected service on a background thread"""
         service_name = self.get_selected_service()
-        if not service_name:
+        if not service_name or self.restart_thread is not None:
             return
         
         if not self.admin_utils.is_admin():
@@ -461,20 +650,67 @@ class ServicesStatusWidget(QWidget):
             )
             
             if reply == QMessageBox.StandardButton.Yes:
-                self.services_manager.restart_service(service_name, self.output_text)
+                self.restart_btn.setEnabled(False)
+                self.restart_thread = ServiceRestartThread(self.services_manager, service_name)
+                self.restart_thread.finished.connect(self.on_restart_finished)
+                self.restart_thread.start()
+    
+    def on_restart_finished(self):
+        """Re-enable the buttons for the selection once a restart has finished"""
+        # run() has returned but the thread may still be winding down; let Qt
+        # delete it once it has
+        self.restart_thread.deleteLater()
+        self.restart_thread = None
+        self.on_service_selection_changed()
+    
+    def wait_for_restart(self):
+        """Let an in-flight restart finish rather than leave the service stopped
+        
+        Called by the main window when the application closes.
+        """
+        if self.restart_thread is not None:
+            self.restart_thread.wait()
     
     def on_operation_completed(self, operation: str, success: bool, message: str):
         """Handle service operation completion"""
         if success:
-            self.output_text.append(f"✓ {operation.capitalize()} operation completed successfully")
+            self.append_log(f"✓ {operation.capitalize()} operation completed successfully")
         else:
-            self.output_text.append(f"✗ {operation.capitalize()} operation failed: {message}")
+            self.append_log(f"✗ {operation.capitalize()} operation failed: {message}")
         
-        # Refresh the display after a short delay
-        QTimer.singleShot(2000, self.refresh_services)
+        # Refresh the display after a short delay, restarting any pending refresh
+        self._pending_refresh_timer.start(2000)
+    
+    def on_log_line(self, operation: str, message: str):
+        """Log progress of service operations; startup changes belong to the config tab"""
+        if operation != "config":
+            self.append_log(message)
+    
+    def append_log(self, text: str):
+        """Queue a line for the output log"""
+        self._log_buffer.append(text)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def flush_log(self):
+        """Write all queued log lines to the output log in one insert"""
+        if not self._log_buffer:
+            return
+        
+        text = "\n".join(self._log_buffer)
+        self._log_buffer.clear()
+        
+        cursor = self.output_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if not self.output_text.document().isEmpty():
+            text = "\n" + text
+        cursor.insertText(text)
+        self.output_text.setTextCursor(cursor)
+        self.output_text.ensureCursorVisible()
     
     def clear_log(self):
         """Clear the output log"""
+        self._log_buffer.clear()
         self.output_text.clear()
         self.output_text.append("Service management log cleared.\n")
     
@@ -486,12 +722,15 @@ class ServicesStatusWidget(QWidget):
 class ServiceConfigWidget(QWidget):
     """Widget for configuring service startup types"""
     
-    def __init__(self):
+    def __init__(self, services_manager: Optional[ServicesManager] = None):
         super().__init__()
-        self.services_manager = ServicesManager()
+        self.services_manager = services_manager or ServicesManager()
         self.admin_utils = AdminUtils()
+        self.service_list_thread = None
         
         self.setup_ui()
+        self.services_manager.log_line.connect(self.on_log_line, Qt.ConnectionType.QueuedConnection)
+        self.populate_service_combo()
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -520,7 +759,6 @@ class ServiceConfigWidget(QWidget):
         
         self.service_combo = QComboBox()
         self.service_combo.setMinimumWidth(300)
-        self.populate_service_combo()
         selection_layout.addWidget(self.service_combo)
         
         selection_layout.addStretch()
@@ -560,6 +798,7 @@ class ServiceConfigWidget(QWidget):
         self.config_output.setObjectName("console")
         self.config_output.setReadOnly(True)
         self.config_output.setMinimumHeight(200)
+        self.config_output.document().setMaximumBlockCount(1000)
         self.config_output.setPlainText("Ready to configure service startup types...\n")
         output_layout.addWidget(self.config_output)
         
@@ -569,14 +808,35 @@ class ServiceConfigWidget(QWidget):
         layout.addStretch()
     
     def populate_service_combo(self):
-        """Populate the service selection combo"""
-        try:
-            services = self.services_manager.get_all_important_services()
-            for service_name, service_info in sorted(services.items(), key=lambda x: x[1].display_name or x[0]):
-                display_text = f"{service_info.display_name or service_name} ({service_name})"
-                self.service_combo.addItem(display_text, service_name)
-        except Exception as e:
-            self.config_output.append(f"Error loading services: {str(e)}")
+        """Populate the service selection combo from the cached snapshot or a background load"""
+        cached_services = self.services_manager.get_cached_services()
+        if cached_services:
+            self.fill_service_combo(sort_services_by_display_name(cached_services))
+            return
+        
+        self.service_combo.setEnabled(False)
+        self.service_list_thread = ServiceListThread(self.services_manager)
+        self.service_list_thread.services_loaded.connect(self.fill_service_combo)
+        self.service_list_thread.error_occurred.connect(self.on_service_list_error)
+        self.service_list_thread.start()
+    
+    def fill_service_combo(self, services: List[ServiceInfo]):
+        """Fill the service combo with services already sorted by display name"""
+        self.service_combo.clear()
+        for service_info in services:
+            display_text = f"{service_info.display_name or service_info.name} ({service_info.name})"
+            self.service_combo.addItem(display_text, service_info.name)
+        self.service_combo.setEnabled(True)
+    
+    def on_service_list_error(self, error: str):
+        """Handle a failed background service load"""
+        self.service_combo.setEnabled(True)
+        self.config_output.append(f"Error loading services: {error}")
+    
+    def on_log_line(self, operation: str, message: str):
+        """Log progress of startup type changes"""
+        if operation == "config":
+            self.config_output.append(message)
     
     def apply_startup_config(self):
         """Apply the selected startup configuration"""
@@ -608,9 +868,7 @@ class ServiceConfigWidget(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            success = self.services_manager.set_service_startup_type(
-                service_name, startup_type, self.config_output
-            )
+            success = self.services_manager.set_service_startup_type(service_name, startup_type)
             
             if success:
                 QMessageBox.information(self, "Success", "Service startup type updated successfully.")
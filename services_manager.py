@@ -1,12 +1,99 @@
+import ctypes
+import json
+import logging
 import subprocess
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from ctypes import wintypes
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 
 from PySide6.QtCore import QObject, Signal, QThread, QTimer
-from PySide6.QtWidgets import QTextEdit
+
+from system_commands import PowerShellRunspace
+
+try:
+    import win32service
+except ImportError:  # pywin32 missing, fall back to sc.exe
+    win32service = None
+
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:
+    pythoncom = None
+    win32com = None
+
+logger = logging.getLogger(__name__)
+
+# Error key -> monotonic time it was last logged
+_last_log: Dict[str, float] = {}
+
+def _log_throttled(key: str, msg: str, interval: float = 60.0):
+    """Log the current exception, at most once per interval for the same key"""
+    now = time.monotonic()
+    last = _last_log.get(key)
+    if last is not None and now - last < interval:
+        return
+    _last_log[key] = now
+    logger.exception(msg)
+
+# SCM status change notifications; pywin32 does not wrap NotifyServiceStatusChange
+SC_MANAGER_CONNECT = 0x0001
+SERVICE_QUERY_STATUS = 0x0004
+SERVICE_NOTIFY_STATUS_CHANGE = 2
+SERVICE_NOTIFY_ALL_STATES = 0x7F  # STOPPED (0x1) through PAUSED (0x40)
+WAIT_OBJECT_0 = 0x00000000
+WAIT_IO_COMPLETION = 0x000000C0
+
+class SERVICE_STATUS_PROCESS(ctypes.Structure):
+    _fields_ = [(name, wintypes.DWORD) for name in (
+        'dwServiceType', 'dwCurrentState', 'dwControlsAccepted', 'dwWin32ExitCode',
+        'dwServiceSpecificExitCode', 'dwCheckPoint', 'dwWaitHint', 'dwProcessId', 'dwServiceFlags',
+    )]
+
+try:
+    _advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    PFN_SC_NOTIFY_CALLBACK = ctypes.WINFUNCTYPE(None, ctypes.c_void_p)
+except (AttributeError, OSError):  # Not on Windows, services are polled
+    _advapi32 = None
+    _kernel32 = None
+    PFN_SC_NOTIFY_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_void_p)
+
+class SERVICE_NOTIFYW(ctypes.Structure):
+    _fields_ = [
+        ('dwVersion', wintypes.DWORD),
+        ('pfnNotifyCallback', PFN_SC_NOTIFY_CALLBACK),
+        ('pContext', ctypes.c_void_p),
+        ('dwNotificationStatus', wintypes.DWORD),
+        ('ServiceStatus', SERVICE_STATUS_PROCESS),
+        ('dwNotificationTriggered', wintypes.DWORD),
+        ('pszServiceNames', wintypes.LPWSTR),
+    ]
+
+if _advapi32 is not None:
+    _advapi32.OpenSCManagerW.argtypes = [wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD]
+    _advapi32.OpenSCManagerW.restype = wintypes.HANDLE
+    _advapi32.OpenServiceW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, wintypes.DWORD]
+    _advapi32.OpenServiceW.restype = wintypes.HANDLE
+    _advapi32.CloseServiceHandle.argtypes = [wintypes.HANDLE]
+    _advapi32.CloseServiceHandle.restype = wintypes.BOOL
+    _advapi32.NotifyServiceStatusChangeW.argtypes = [
+        wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(SERVICE_NOTIFYW)
+    ]
+    _advapi32.NotifyServiceStatusChangeW.restype = wintypes.DWORD
+    _kernel32.CreateEventW.argtypes = [ctypes.c_void_p, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+    _kernel32.CreateEventW.restype = wintypes.HANDLE
+    _kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+    _kernel32.SetEvent.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _kernel32.WaitForSingleObjectEx.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.BOOL]
+    _kernel32.WaitForSingleObjectEx.restype = wintypes.DWORD
 
 class ServiceStatus(Enum):
     STOPPED = "STOPPED"
@@ -25,6 +112,162 @@ class ServiceStartType(Enum):
     DISABLED = "DISABLED"
     UNKNOWN = "UNKNOWN"
 
+# SCM dwCurrentState / dwStartType codes
+NATIVE_SERVICE_STATUS = {
+    1: ServiceStatus.STOPPED,
+    2: ServiceStatus.START_PENDING,
+    3: ServiceStatus.STOP_PENDING,
+    4: ServiceStatus.RUNNING,
+    5: ServiceStatus.CONTINUE_PENDING,
+    6: ServiceStatus.PAUSE_PENDING,
+    7: ServiceStatus.PAUSED,
+}
+
+NATIVE_START_TYPE = {
+    2: ServiceStartType.AUTOMATIC,
+    3: ServiceStartType.MANUAL,
+    4: ServiceStartType.DISABLED,
+}
+
+# sc query STATE names
+SC_SERVICE_STATUS = {
+    'STOPPED': ServiceStatus.STOPPED,
+    'START_PENDING': ServiceStatus.START_PENDING,
+    'STOP_PENDING': ServiceStatus.STOP_PENDING,
+    'RUNNING': ServiceStatus.RUNNING,
+    'CONTINUE_PENDING': ServiceStatus.CONTINUE_PENDING,
+    'PAUSE_PENDING': ServiceStatus.PAUSE_PENDING,
+    'PAUSED': ServiceStatus.PAUSED,
+}
+
+# Win32_Service State / StartMode values (lowercased)
+CIM_SERVICE_STATUS = {
+    'stopped': ServiceStatus.STOPPED,
+    'start pending': ServiceStatus.START_PENDING,
+    'stop pending': ServiceStatus.STOP_PENDING,
+    'running': ServiceStatus.RUNNING,
+    'continue pending': ServiceStatus.CONTINUE_PENDING,
+    'pause pending': ServiceStatus.PAUSE_PENDING,
+    'paused': ServiceStatus.PAUSED,
+}
+
+CIM_START_TYPE = {
+    'auto': ServiceStartType.AUTOMATIC,
+    'manual': ServiceStartType.MANUAL,
+    'disabled': ServiceStartType.DISABLED,
+}
+
+IMPORTANT_SERVICES = MappingProxyType({
+    # Windows Update Services
+    'wuauserv': 'Windows Update',
+    'bits': 'Background Intelligent Transfer Service',
+    'cryptsvc': 'Cryptographic Services',
+    'msiserver': 'Windows Installer',
+    'trustedinstaller': 'Windows Modules Installer',
+    
+    # System Services
+    'eventlog': 'Windows Event Log',
+    'winmgmt': 'Windows Management Instrumentation',
+    'rpcss': 'Remote Procedure Call (RPC)',
+    'dcomlaunch': 'DCOM Server Process Launcher',
+    'plugplay': 'Plug and Play',
+    'power': 'Power',
+    'themes': 'Themes',
+    'audiosrv': 'Windows Audio',
+    'audioendpointbuilder': 'Windows Audio Endpoint Builder',
+    
+    # Network Services
+    'lanmanserver': 'Server',
+    'lanmanworkstation': 'Workstation',
+    'dnscache': 'DNS Client',
+    'dhcp': 'DHCP Client',
+    'netlogon': 'Netlogon',
+    'netman': 'Network Connections',
+    'nsi': 'Network Store Interface Service',
+    
+    # Security Services
+    'mpssvc': 'Windows Defender Firewall',
+    'windefend': 'Windows Defender Antivirus Service',
+    'wscsvc': 'Security Center',
+    'wersvc': 'Windows Error Reporting Service',
+    
+    # Print and Fax Services
+    'spooler': 'Print Spooler',
+    'fax': 'Fax',
+    
+    # Remote Services
+    'termservice': 'Remote Desktop Services',
+    'remoteregistry': 'Remote Registry',
+    'remoteaccess': 'Routing and Remote Access',
+    
+    # Storage Services
+    'vss': 'Volume Shadow Copy',
+    'swprv': 'Microsoft Software Shadow Copy Provider',
+    'vds': 'Virtual Disk',
+    
+    # Task Scheduler
+    'schedule': 'Task Scheduler',
+    
+    # Windows Search
+    'wsearch': 'Windows Search',
+    
+    # Windows Time
+    'w32time': 'Windows Time',
+    
+    # User Profile Service
+    'profSvc': 'User Profile Service',
+    
+    # Windows License Manager
+    'licensingservice': 'Windows License Manager Service',
+})
+
+SERVICE_DESCRIPTIONS = MappingProxyType({
+    'wuauserv': 'Enables the detection, download, and installation of updates for Windows and other programs.',
+    'bits': 'Transfers files in the background using idle network bandwidth.',
+    'cryptsvc': 'Provides three management services: Catalog Database Service, Protected Root Service, and Automatic Root Certificate Update Service.',
+    'msiserver': 'Installs, modifies, and removes applications provided as Windows Installer packages.',
+    'trustedinstaller': 'Enables installation, modification, and removal of Windows updates and optional components.',
+    'eventlog': 'Enables event log messages issued by Windows-based programs and components to be viewed in Event Viewer.',
+    'winmgmt': 'Provides a common interface and object model to access management information about operating system, devices, applications and services.',
+    'rpcss': 'Serves as the endpoint mapper and COM Service Control Manager.',
+    'dcomlaunch': 'Provides launch functionality for DCOM services.',
+    'plugplay': 'Enables a computer to recognize and adapt to hardware changes with little or no user input.',
+    'power': 'Manages power policy and power policy notification delivery.',
+    'themes': 'Provides user experience theme management.',
+    'audiosrv': 'Manages audio for Windows-based programs.',
+    'audioendpointbuilder': 'Manages audio devices for the Windows Audio service.',
+    'lanmanserver': 'Supports file, print, and named-pipe sharing over the network.',
+    'lanmanworkstation': 'Creates and maintains client network connections to remote servers.',
+    'dnscache': 'Caches Domain Name System (DNS) names and registers the full computer name.',
+    'dhcp': 'Registers and updates IP addresses and DNS records for this computer.',
+    'netlogon': 'Maintains a secure channel between this computer and the domain controller.',
+    'netman': 'Manages objects in the Network and Dial-Up Connections folder.',
+    'nsi': 'Collects and stores network configuration and location information.',
+    'mpssvc': 'Provides host-based firewall enforcement for the operating system.',
+    'windefend': 'Helps protect users from malware and other potentially unwanted software.',
+    'wscsvc': 'Monitors and reports security health settings on the computer.',
+    'wersvc': 'Allows errors to be reported when programs stop working or responding.',
+    'spooler': 'Loads files to memory for later printing.',
+    'fax': 'Enables you to send and receive faxes.',
+    'termservice': 'Allows users to connect interactively to a remote computer.',
+    'remoteregistry': 'Enables remote users to modify registry settings on this computer.',
+    'remoteaccess': 'Offers routing services to businesses in local area and wide area network environments.',
+    'vss': 'Manages and implements Volume Shadow Copies used for backup and other purposes.',
+    'swprv': 'Manages software-based volume shadow copies taken by the Volume Shadow Copy service.',
+    'vds': 'Provides management services for disks, volumes, file systems, and storage arrays.',
+    'schedule': 'Enables a user to configure and schedule automated tasks on this computer.',
+    'wsearch': 'Provides content indexing, property caching, and search results for files, e-mail, and other content.',
+    'w32time': 'Maintains date and time synchronization on all clients and servers in the network.',
+    'profSvc': 'Responsible for loading and unloading user profiles.',
+    'licensingservice': 'Provides infrastructure support for the Microsoft Store.',
+})
+
+# service_name -> (display name, description), so lookups take one probe
+_SERVICE_METADATA = MappingProxyType({
+    name: (display_name, SERVICE_DESCRIPTIONS.get(name, "No description available"))
+    for name, display_name in IMPORTANT_SERVICES.items()
+})
+
 @dataclass
 class ServiceInfo:
     name: str
@@ -35,143 +278,285 @@ class ServiceInfo:
     pid: Optional[int] = None
     can_stop: bool = True
     can_pause: bool = False
+    name_lower: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Lowercased once here so filters don't lower the name on every pass
+        self.name_lower = self.name.lower()
 
 class ServicesManager(QObject):
     service_updated = Signal(str, ServiceInfo)  # service_name, service_info
     operation_completed = Signal(str, bool, str)  # operation, success, message
+    log_line = Signal(str, str)  # operation, message
+    cache_stats_updated = Signal(int, int)  # cache hits, cache misses
+    
+    # Service state changes often, configuration rarely
+    STATUS_CACHE_TTL = 2.0  # seconds
+    CONFIG_CACHE_TTL = 30.0  # seconds
+    STATUS_WAIT_TIMEOUT = 30.0  # seconds
+    
+    # Settable start types as SCM dwStartType codes and Set-Service names
+    _START_TYPE_WIN32 = MappingProxyType({
+        ServiceStartType.AUTOMATIC: 2,  # SERVICE_AUTO_START
+        ServiceStartType.MANUAL: 3,  # SERVICE_DEMAND_START
+        ServiceStartType.DISABLED: 4,  # SERVICE_DISABLED
+    })
+    _START_TYPE_POWERSHELL = MappingProxyType({
+        ServiceStartType.AUTOMATIC: 'Automatic',
+        ServiceStartType.MANUAL: 'Manual',
+        ServiceStartType.DISABLED: 'Disabled',
+    })
     
     def __init__(self):
         super().__init__()
-        self.important_services = {
-            # Windows Update Services
-            'wuauserv': 'Windows Update',
-            'bits': 'Background Intelligent Transfer Service',
-            'cryptsvc': 'Cryptographic Services',
-            'msiserver': 'Windows Installer',
-            'trustedinstaller': 'Windows Modules Installer',
-            
-            # System Services
-            'eventlog': 'Windows Event Log',
-            'winmgmt': 'Windows Management Instrumentation',
-            'rpcss': 'Remote Procedure Call (RPC)',
-            'dcomlaunch': 'DCOM Server Process Launcher',
-            'plugplay': 'Plug and Play',
-            'power': 'Power',
-            'themes': 'Themes',
-            'audiosrv': 'Windows Audio',
-            'audioendpointbuilder': 'Windows Audio Endpoint Builder',
-            
-            # Network Services
-            'lanmanserver': 'Server',
-            'lanmanworkstation': 'Workstation',
-            'dnscache': 'DNS Client',
-            'dhcp': 'DHCP Client',
-            'netlogon': 'Netlogon',
-            'netman': 'Network Connections',
-            'nsi': 'Network Store Interface Service',
-            
-            # Security Services
-            'mpssvc': 'Windows Defender Firewall',
-            'windefend': 'Windows Defender Antivirus Service',
-            'wscsvc': 'Security Center',
-            'wersvc': 'Windows Error Reporting Service',
-            
-            # Print and Fax Services
-            'spooler': 'Print Spooler',
-            'fax': 'Fax',
-            
-            # Remote Services
-            'termservice': 'Remote Desktop Services',
-            'remoteregistry': 'Remote Registry',
-            'remoteaccess': 'Routing and Remote Access',
-            
-            # Storage Services
-            'vss': 'Volume Shadow Copy',
-            'swprv': 'Microsoft Software Shadow Copy Provider',
-            'vds': 'Virtual Disk',
-            
-            # Task Scheduler
-            'schedule': 'Task Scheduler',
-            
-            # Windows Search
-            'wsearch': 'Windows Search',
-            
-            # Windows Time
-            'w32time': 'Windows Time',
-            
-            # User Profile Service
-            'profSvc': 'User Profile Service',
-            
-            # Windows License Manager
-            'licensingservice': 'Windows License Manager Service',
-        }
+        # Shared, read-only service tables
+        self.important_services = IMPORTANT_SERVICES
+        self.service_descriptions = SERVICE_DESCRIPTIONS
         
-        self.service_descriptions = {
-            'wuauserv': 'Enables the detection, download, and installation of updates for Windows and other programs.',
-            'bits': 'Transfers files in the background using idle network bandwidth.',
-            'cryptsvc': 'Provides three management services: Catalog Database Service, Protected Root Service, and Automatic Root Certificate Update Service.',
-            'msiserver': 'Installs, modifies, and removes applications provided as Windows Installer packages.',
-            'trustedinstaller': 'Enables installation, modification, and removal of Windows updates and optional components.',
-            'eventlog': 'Enables event log messages issued by Windows-based programs and components to be viewed in Event Viewer.',
-            'winmgmt': 'Provides a common interface and object model to access management information about operating system, devices, applications and services.',
-            'rpcss': 'Serves as the endpoint mapper and COM Service Control Manager.',
-            'dcomlaunch': 'Provides launch functionality for DCOM services.',
-            'plugplay': 'Enables a computer to recognize and adapt to hardware changes with little or no user input.',
-            'power': 'Manages power policy and power policy notification delivery.',
-            'themes': 'Provides user experience theme management.',
-            'audiosrv': 'Manages audio for Windows-based programs.',
-            'audioendpointbuilder': 'Manages audio devices for the Windows Audio service.',
-            'lanmanserver': 'Supports file, print, and named-pipe sharing over the network.',
-            'lanmanworkstation': 'Creates and maintains client network connections to remote servers.',
-            'dnscache': 'Caches Domain Name System (DNS) names and registers the full computer name.',
-            'dhcp': 'Registers and updates IP addresses and DNS records for this computer.',
-            'netlogon': 'Maintains a secure channel between this computer and the domain controller.',
-            'netman': 'Manages objects in the Network and Dial-Up Connections folder.',
-            'nsi': 'Collects and stores network configuration and location information.',
-            'mpssvc': 'Provides host-based firewall enforcement for the operating system.',
-            'windefend': 'Helps protect users from malware and other potentially unwanted software.',
-            'wscsvc': 'Monitors and reports security health settings on the computer.',
-            'wersvc': 'Allows errors to be reported when programs stop working or responding.',
-            'spooler': 'Loads files to memory for later printing.',
-            'fax': 'Enables you to send and receive faxes.',
-            'termservice': 'Allows users to connect interactively to a remote computer.',
-            'remoteregistry': 'Enables remote users to modify registry settings on this computer.',
-            'remoteaccess': 'Offers routing services to businesses in local area and wide area network environments.',
-            'vss': 'Manages and implements Volume Shadow Copies used for backup and other purposes.',
-            'swprv': 'Manages software-based volume shadow copies taken by the Volume Shadow Copy service.',
-            'vds': 'Provides management services for disks, volumes, file systems, and storage arrays.',
-            'schedule': 'Enables a user to configure and schedule automated tasks on this computer.',
-            'wsearch': 'Provides content indexing, property caching, and search results for files, e-mail, and other content.',
-            'w32time': 'Maintains date and time synchronization on all clients and servers in the network.',
-            'profSvc': 'Responsible for loading and unloading user profiles.',
-            'licensingservice': 'Provides infrastructure support for the Microsoft Store.',
-        }
+        # Last snapshot returned by get_all_important_services
+        self._cached_services: Optional[Dict[str, ServiceInfo]] = None
+        
+        # Service Control Manager handle, opened on first native query
+        self._scm = None
+        
+        # service_name -> (monotonic timestamp, value)
+        self._cache: Dict[str, Tuple[float, ServiceInfo]] = {}
+        self._config_cache: Dict[str, Tuple[float, ServiceStartType]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # WMI connections are COM objects bound to the thread that created them
+        self._wmi_local = threading.local()
+        self._wmi_query = (
+            "SELECT Name,State,StartMode,ProcessId FROM Win32_Service WHERE "
+            + " OR ".join(f"Name='{name}'" for name in self.important_services)
+        )
+        
+        # Allow spawning PowerShell/sc.exe when the in-process queries fail
+        self.subprocess_fallback = True
+        
+        # Worker pool for per-service queries, created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._pool_lock = threading.Lock()
     
-    def get_service_info(self, service_name: str) -> Optional[ServiceInfo]:
-        """Get detailed information about a specific service"""
+    def get_service_info(self, service_name: str, *, fetch_config: bool = True) -> Optional[ServiceInfo]:
+        """Get detailed information about a specific service
+        
+        With fetch_config=False only the service state is queried; the start
+        type is the last known one, or UNKNOWN if it was never queried.
+        """
+        cached = self._cache.get(service_name)
+        if cached and time.monotonic() - cached[0] < self.STATUS_CACHE_TTL:
+            self.cache_hits += 1
+            return cached[1]
+        self.cache_misses += 1
+        
         try:
-            # Get service status using sc query
-            result = subprocess.run(
-                ['sc', 'query', service_name],
-                capture_output=True,
-                text=True,
-                timeout=10
+            if win32service is not None:
+                service_info = self._get_service_info_native(service_name, fetch_config)
+            else:
+                service_info = self._get_service_info_sc(service_name, fetch_config)
+        except Exception as e:
+            _log_throttled(f"service_info:{service_name}", f"Error getting service info for {service_name}: {e}")
+            return None
+        
+        # A state-only result without a known start type must not satisfy later full queries
+        if service_info and (fetch_config or service_info.start_type != ServiceStartType.UNKNOWN):
+            self._cache[service_name] = (time.monotonic(), service_info)
+        return service_info
+    
+    def invalidate_service(self, service_name: str):
+        """Drop cached state and configuration after a service was changed"""
+        self._cache.pop(service_name, None)
+        self._config_cache.pop(service_name, None)
+    
+    def _get_cached_start_type(self, service_name: str, fresh: bool = True) -> Optional[ServiceStartType]:
+        """Get the start type if it was queried within CONFIG_CACHE_TTL, or at all if not fresh"""
+        cached = self._config_cache.get(service_name)
+        if cached and (not fresh or time.monotonic() - cached[0] < self.CONFIG_CACHE_TTL):
+            self.cache_hits += 1
+            return cached[1]
+        self.cache_misses += 1
+        return None
+    
+    def _cache_start_type(self, service_name: str, start_type: ServiceStartType):
+        self._config_cache[service_name] = (time.monotonic(), start_type)
+    
+    def _get_scm(self):
+        """Get the cached Service Control Manager handle"""
+        if self._scm is None:
+            self._scm = win32service.OpenSCManager(
+                None, None,
+                win32service.SC_MANAGER_CONNECT | win32service.SC_MANAGER_ENUMERATE_SERVICE
             )
+        return self._scm
+    
+    def _get_service_info_native(self, service_name: str, fetch_config: bool = True) -> Optional[ServiceInfo]:
+        """Query a single service through the SCM"""
+        start_type = self._get_cached_start_type(service_name, fresh=fetch_config)
+        if start_type is None and not fetch_config:
+            start_type = ServiceStartType.UNKNOWN
+        access = win32service.SERVICE_QUERY_STATUS
+        if start_type is None:
+            access |= win32service.SERVICE_QUERY_CONFIG
+        
+        try:
+            handle = win32service.OpenService(self._get_scm(), service_name, access)
+        except win32service.error:
+            return None  # Service not installed
+        
+        try:
+            status = win32service.QueryServiceStatusEx(handle)
+            if start_type is None:
+                start_type = NATIVE_START_TYPE.get(win32service.QueryServiceConfig(handle)[1],
+                                                   ServiceStartType.UNKNOWN)
+                self._cache_start_type(service_name, start_type)
+        finally:
+            win32service.CloseServiceHandle(handle)
+        
+        return self._build_service_info(
+            service_name,
+            NATIVE_SERVICE_STATUS.get(status['CurrentState'], ServiceStatus.UNKNOWN),
+            start_type,
+            status['ProcessId'] or None
+        )
+    
+    def _get_services_native(self) -> Dict[str, ServiceInfo]:
+        """Query all important services with one SCM enumeration"""
+        scm = self._get_scm()
+        
+        # State and PID of every Win32 service in one call
+        entries = {
+            entry['ServiceName'].lower(): entry
+            for entry in win32service.EnumServicesStatusEx(
+                scm, win32service.SERVICE_WIN32, win32service.SERVICE_STATE_ALL,
+                None, win32service.SC_ENUM_PROCESS_INFO
+            )
+        }
+        
+        services = {}
+        for service_name in self.important_services:
+            entry = entries.get(service_name.lower())
+            if entry is None:
+                continue
+            
+            # The start type is only available from the service configuration,
+            # which rarely changes, so it is re-read only once the cache expires
+            start_type = self._get_cached_start_type(service_name)
+            if start_type is None:
+                start_type = ServiceStartType.UNKNOWN
+                try:
+                    handle = win32service.OpenService(scm, entry['ServiceName'], win32service.SERVICE_QUERY_CONFIG)
+                    try:
+                        start_type = NATIVE_START_TYPE.get(win32service.QueryServiceConfig(handle)[1],
+                                                           ServiceStartType.UNKNOWN)
+                        self._cache_start_type(service_name, start_type)
+                    finally:
+                        win32service.CloseServiceHandle(handle)
+                except win32service.error:
+                    pass
             
-            if result.returncode != 0:
-                return None
-            
-            # Parse sc query output
-            lines = result.stdout.strip().split('\n')
-            status_info = {}
-            
-            for line in lines:
-                line = line.strip()
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    status_info[key.strip()] = value.strip()
-            
-            # Get service configuration
+            services[service_name] = self._build_service_info(
+                service_name,
+                NATIVE_SERVICE_STATUS.get(entry['CurrentState'], ServiceStatus.UNKNOWN),
+                start_type,
+                entry['ProcessId'] or None
+            )
+        return services
+    
+    def _get_wmi(self):
+        """Get this thread's WMI connection"""
+        connection = getattr(self._wmi_local, 'connection', None)
+        if connection is None:
+            pythoncom.CoInitialize()
+            connection = win32com.client.GetObject("winmgmts:\\\\.\\root\\cimv2")
+            self._wmi_local.connection = connection
+        return connection
+    
+    def _get_services_wmi(self) -> Dict[str, ServiceInfo]:
+        """Query all important services with one in-process WMI query"""
+        entries = {service.Name.lower(): service for service in self._get_wmi().ExecQuery(self._wmi_query)}
+        
+        services = {}
+        for service_name in self.important_services:
+            service = entries.get(service_name.lower())
+            if service is not None:
+                services[service_name] = self._service_info_from_cim(
+                    service_name, service.State, service.StartMode, service.ProcessId
+                )
+        return services
+    
+    def _service_info_from_cim(self, service_name: str, state: Optional[str],
+                               start_mode: Optional[str], process_id: Optional[int]) -> ServiceInfo:
+        """Build a ServiceInfo from Win32_Service fields"""
+        start_type = CIM_START_TYPE.get((start_mode or '').lower(), ServiceStartType.UNKNOWN)
+        self._cache_start_type(service_name, start_type)
+        
+        return self._build_service_info(
+            service_name,
+            CIM_SERVICE_STATUS.get((state or '').lower(), ServiceStatus.UNKNOWN),
+            start_type,
+            process_id or None
+        )
+    
+    def _get_services_powershell(self) -> Optional[Dict[str, ServiceInfo]]:
+        """Query all important services with a single PowerShell CIM call"""
+        returncode, stdout, _ = PowerShellRunspace.instance().run(
+            'Get-CimInstance Win32_Service | Select-Object Name,State,StartMode,ProcessId | '
+            'ConvertTo-Json -Compress',
+            timeout=30
+        )
+        
+        if returncode != 0 or not stdout.strip():
+            return None
+        
+        records = json.loads(stdout)
+        if isinstance(records, dict):
+            records = [records]
+        entries = {record['Name'].lower(): record for record in records if record.get('Name')}
+        
+        services = {}
+        for service_name in self.important_services:
+            record = entries.get(service_name.lower())
+            if record is not None:
+                services[service_name] = self._service_info_from_cim(
+                    service_name, record.get('State'), record.get('StartMode'), record.get('ProcessId')
+                )
+        return services
+    
+    def _get_service_info_sc(self, service_name: str, fetch_config: bool = True) -> Optional[ServiceInfo]:
+        """Query a single service by parsing sc.exe output"""
+        # Get service status using sc query
+        result = subprocess.run(
+            ['sc', 'query', service_name],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        
+        if result.returncode != 0:
+            return None
+        
+        # Parse sc query output, e.g. "STATE              : 4  RUNNING"
+        status = ServiceStatus.UNKNOWN
+        pid = None
+        for line in result.stdout.splitlines():
+            key, _, value = line.partition(':')
+            key = key.strip()
+            if key == 'STATE':
+                words = value.split()
+                if words:
+                    status = SC_SERVICE_STATUS.get(words[-1].upper(), ServiceStatus.UNKNOWN)
+            elif key == 'PID':
+                value = value.strip()
+                if value.isdigit():
+                    pid = int(value)
+        
+        # Get service configuration unless the start type is still cached
+        start_type = self._get_cached_start_type(service_name, fresh=fetch_config)
+        if start_type is None and not fetch_config:
+            start_type = ServiceStartType.UNKNOWN
+        if start_type is None:
             config_result = subprocess.run(
                 ['sc', 'qc', service_name],
                 capture_output=True,
@@ -179,245 +564,417 @@ class ServicesManager(QObject):
                 timeout=10
             )
             
-            config_info = {}
             if config_result.returncode == 0:
-                config_lines = config_result.stdout.strip().split('\n')
-                for line in config_lines:
-                    line = line.strip()
-                    if ':' in line:
-                        key, value = line.split(':', 1)
-                        config_info[key.strip()] = value.strip()
-            
-            # Parse status
-            state_str = status_info.get('STATE', '').upper()
-            if 'RUNNING' in state_str:
-                status = ServiceStatus.RUNNING
-            elif 'STOPPED' in state_str:
-                status = ServiceStatus.STOPPED
-            elif 'PAUSED' in state_str:
-                status = ServiceStatus.PAUSED
-            elif 'START_PENDING' in state_str:
-                status = ServiceStatus.START_PENDING
-            elif 'STOP_PENDING' in state_str:
-                status = ServiceStatus.STOP_PENDING
-            elif 'CONTINUE_PENDING' in state_str:
-                status = ServiceStatus.CONTINUE_PENDING
-            elif 'PAUSE_PENDING' in state_str:
-                status = ServiceStatus.PAUSE_PENDING
-            else:
-                status = ServiceStatus.UNKNOWN
-            
-            # Parse start type
-            start_type_str = config_info.get('START_TYPE', '').upper()
-            if 'AUTO_START' in start_type_str or start_type_str == '2':
-                start_type = ServiceStartType.AUTOMATIC
-            elif 'DEMAND_START' in start_type_str or start_type_str == '3':
-                start_type = ServiceStartType.MANUAL
-            elif 'DISABLED' in start_type_str or start_type_str == '4':
-                start_type = ServiceStartType.DISABLED
+                # e.g. "START_TYPE         : 2   AUTO_START"
+                start_type = ServiceStartType.UNKNOWN
+                for line in config_result.stdout.splitlines():
+                    key, _, value = line.partition(':')
+                    if key.strip() == 'START_TYPE':
+                        words = value.split()
+                        if words and words[0].isdigit():
+                            start_type = NATIVE_START_TYPE.get(int(words[0]), ServiceStartType.UNKNOWN)
+                        break
+                self._cache_start_type(service_name, start_type)
             else:
                 start_type = ServiceStartType.UNKNOWN
-            
-            # Extract PID if running
-            pid = None
-            if 'PID' in status_info:
-                try:
-                    pid = int(status_info['PID'])
-                except ValueError:
-                    pass
-            
-            # Get display name and description
-            display_name = self.important_services.get(service_name, service_name)
-            description = self.service_descriptions.get(service_name, "No description available")
-            
-            # Determine capabilities
-            can_stop = status == ServiceStatus.RUNNING
-            can_pause = False  # Most services don't support pause
-            
-            return ServiceInfo(
-                name=service_name,
-                display_name=display_name,
-                status=status,
-                start_type=start_type,
-                description=description,
-                pid=pid,
-                can_stop=can_stop,
-                can_pause=can_pause
-            )
-            
-        except Exception as e:
-            print(f"Error getting service info for {service_name}: {e}")
-            return None
+        
+        return self._build_service_info(service_name, status, start_type, pid)
+    
+    def _build_service_info(self, service_name: str, status: ServiceStatus,
+                            start_type: ServiceStartType, pid: Optional[int]) -> ServiceInfo:
+        """Combine queried state with the known display name and description"""
+        # Get display name and description
+        display_name, description = _SERVICE_METADATA.get(
+            service_name, (service_name, "No description available")
+        )
+        
+        # Determine capabilities
+        can_stop = status == ServiceStatus.RUNNING
+        can_pause = False  # Most services don't support pause
+        
+        return ServiceInfo(
+            name=service_name,
+            display_name=display_name,
+            status=status,
+            start_type=start_type,
+            description=description,
+            pid=pid,
+            can_stop=can_stop,
+            can_pause=can_pause
+        )
     
     def get_all_important_services(self) -> Dict[str, ServiceInfo]:
         """Get information for all important services"""
-        services = {}
-        for service_name in self.important_services.keys():
-            service_info = self.get_service_info(service_name)
-            if service_info:
-                services[service_name] = service_info
+        # In-process queries first; PowerShell costs one subprocess for all
+        # services instead of two per service
+        backends = []
+        if win32service is not None:
+            backends.append(self._get_services_native)
+        if win32com is not None:
+            backends.append(self._get_services_wmi)
+        if self.subprocess_fallback:
+            backends.append(self._get_services_powershell)
+        
+        services = None
+        for backend in backends:
+            try:
+                services = backend()
+            except Exception as e:
+                _log_throttled(f"enumerate:{backend.__name__}", f"Error enumerating services: {e}")
+            if services is not None:
+                break
+        
+        if services is None:
+            # Per-service queries wait on the SCM or a subprocess, so run them concurrently
+            service_names = list(self.important_services)
+            results = self._get_pool().map(self.get_service_info, service_names)
+            services = {name: info for name, info in zip(service_names, results) if info}
+        self._cached_services = services
+        self.cache_stats_updated.emit(self.cache_hits, self.cache_misses)
         return services
     
-    def start_service(self, service_name: str, output_widget: Optional[QTextEdit] = None) -> bool:
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the worker pool for per-service queries"""
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="svc")
+            return self._pool
+    
+    def close(self):
+        """Shut down the worker pool; it is recreated if queried again"""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
+    
+    def get_cached_services(self) -> Optional[Dict[str, ServiceInfo]]:
+        """Get the last services snapshot without querying, or None if none was taken yet"""
+        return self._cached_services
+    
+    def _call_service_native(self, service_name: str, access: int, call) -> Tuple[bool, str]:
+        """Open a service with the given access rights and run call(handle) on it"""
+        try:
+            handle = win32service.OpenService(self._get_scm(), service_name, access)
+            try:
+                call(handle)
+            finally:
+                win32service.CloseServiceHandle(handle)
+            return True, ""
+        except win32service.error as e:
+            return False, e.strerror
+    
+    def _run_service_cmdlet(self, script: str, timeout: float) -> Tuple[bool, str]:
+        """Run a service cmdlet in the shared PowerShell runspace"""
+        returncode, stdout, stderr = PowerShellRunspace.instance().run(script, timeout=timeout)
+        success = returncode == 0
+        return success, stdout if success else stderr.strip()
+    
+    def wait_for_status(self, service_name: str, status: ServiceStatus,
+                        timeout: Optional[float] = None) -> bool:
+        """Poll a service until it reaches a status; False if the timeout expires first"""
+        if timeout is None:
+            timeout = self.STATUS_WAIT_TIMEOUT
+        # Native queries are cheap, sc.exe costs a process per poll
+        poll_interval = 0.05 if win32service is not None else 0.5
+        deadline = time.monotonic() + timeout
+        
+        while True:
+            self._cache.pop(service_name, None)
+            service_info = self.get_service_info(service_name, fetch_config=False)
+            if service_info and service_info.status == status:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(poll_interval)
+    
+    def start_service(self, service_name: str) -> bool:
         """Start a Windows service"""
         try:
-            if output_widget:
-                output_widget.append(f"Starting service: {service_name}")
+            self.log_line.emit("start", f"Starting service: {service_name}")
             
-            result = subprocess.run(
-                ['sc', 'start', service_name],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            success = result.returncode == 0
-            message = result.stdout if success else result.stderr
-            
-            if output_widget:
-                if success:
-                    output_widget.append(f"✓ Service {service_name} started successfully")
-                else:
-                    output_widget.append(f"✗ Failed to start service {service_name}: {message}")
+            if win32service is not None:
+                success, message = self._call_service_native(
+                    service_name, win32service.SERVICE_START,
+                    lambda handle: win32service.StartService(handle, None)
+                )
+            else:
+                success, message = self._run_service_cmdlet(
+                    f"Start-Service -Name {powershell_quote(service_name)}", timeout=30
+                )
+            if success:
+                self.invalidate_service(service_name)
+                self.log_line.emit("start", f"✓ Service {service_name} started successfully")
+            else:
+                self.log_line.emit("start", f"✗ Failed to start service {service_name}: {message}")
             
             self.operation_completed.emit("start", success, message)
             return success
             
         except Exception as e:
             error_msg = f"Error starting service {service_name}: {str(e)}"
-            if output_widget:
-                output_widget.append(f"✗ {error_msg}")
+            self.log_line.emit("start", f"✗ {error_msg}")
             self.operation_completed.emit("start", False, error_msg)
             return False
     
-    def stop_service(self, service_name: str, output_widget: Optional[QTextEdit] = None) -> bool:
+    def stop_service(self, service_name: str) -> bool:
         """Stop a Windows service"""
         try:
-            if output_widget:
-                output_widget.append(f"Stopping service: {service_name}")
-            
-            result = subprocess.run(
-                ['sc', 'stop', service_name],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            self.log_line.emit("stop", f"Stopping service: {service_name}")
             
-            success = result.returncode == 0
-            message = result.stdout if success else result.stderr
-            
-            if output_widget:
-                if success:
-                    output_widget.append(f"✓ Service {service_name} stopped successfully")
-                else:
-                    output_widget.append(f"✗ Failed to stop service {service_name}: {message}")
+            if win32service is not None:
+                success, message = self._call_service_native(
+                    service_name, win32service.SERVICE_STOP,
+                    lambda handle: win32service.ControlService(handle, win32service.SERVICE_CONTROL_STOP)
+                )
+            else:
+                success, message = self._run_service_cmdlet(
+                    f"Stop-Service -Name {powershell_quote(service_name)}", timeout=30
+                )
+            if success:
+                self.invalidate_service(service_name)
+                self.log_line.emit("stop", f"✓ Service {service_name} stopped successfully")
+            else:
+                self.log_line.emit("stop", f"✗ Failed to stop service {service_name}: {message}")
             
             self.operation_completed.emit("stop", success, message)
             return success
             
         except Exception as e:
             error_msg = f"Error stopping service {service_name}: {str(e)}"
-            if output_widget:
-                output_widget.append(f"✗ {error_msg}")
+            self.log_line.emit("stop", f"✗ {error_msg}")
             self.operation_completed.emit("stop", False, error_msg)
             return False
     
-    def restart_service(self, service_name: str, output_widget: Optional[QTextEdit] = None) -> bool:
+    def restart_service(self, service_name: str) -> bool:
         """Restart a Windows service"""
         try:
-            if output_widget:
-                output_widget.append(f"Restarting service: {service_name}")
+            self.log_line.emit("restart", f"Restarting service: {service_name}")
             
             # First stop the service
-            stop_success = self.stop_service(service_name, output_widget)
+            stop_success = self.stop_service(service_name)
             if not stop_success:
                 return False
             
-            # Wait a moment for the service to fully stop
-            time.sleep(2)
+            # Continue as soon as the service has fully stopped
+            if not self.wait_for_status(service_name, ServiceStatus.STOPPED):
+                error_msg = f"Service {service_name} did not stop within {self.STATUS_WAIT_TIMEOUT:.0f} seconds"
+                self.log_line.emit("restart", f"✗ {error_msg}")
+                self.operation_completed.emit("restart", False, error_msg)
+                return False
             
             # Then start the service
-            start_success = self.start_service(service_name, output_widget)
+            start_success = self.start_service(service_name)
             
-            if start_success and output_widget:
-                output_widget.append(f"✓ Service {service_name} restarted successfully")
+            if start_success:
+                self.log_line.emit("restart", f"✓ Service {service_name} restarted successfully")
             
             return start_success
             
         except Exception as e:
             error_msg = f"Error restarting service {service_name}: {str(e)}"
-            if output_widget:
-                output_widget.append(f"✗ {error_msg}")
+            self.log_line.emit("restart", f"✗ {error_msg}")
             self.operation_completed.emit("restart", False, error_msg)
             return False
     
-    def set_service_startup_type(self, service_name: str, start_type: ServiceStartType, output_widget: Optional[QTextEdit] = None) -> bool:
+    def set_service_startup_type(self, service_name: str, start_type: ServiceStartType) -> bool:
         """Set the startup type for a service"""
+        native_start_type = self._START_TYPE_WIN32.get(start_type)
+        if native_start_type is None:
+            raise ValueError(f"Unsupported start type: {start_type}")
+        
         try:
-            if output_widget:
-                output_widget.append(f"Setting startup type for {service_name} to {start_type.value}")
-            
-            # Map enum to sc config values
-            type_map = {
-                ServiceStartType.AUTOMATIC: 'auto',
-                ServiceStartType.MANUAL: 'demand',
-                ServiceStartType.DISABLED: 'disabled'
-            }
-            
-            if start_type not in type_map:
-                raise ValueError(f"Unsupported start type: {start_type}")
-            
-            result = subprocess.run(
-                ['sc', 'config', service_name, 'start=', type_map[start_type]],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            
-            success = result.returncode == 0
-            message = result.stdout if success else result.stderr
-            
-            if output_widget:
-                if success:
-                    output_widget.append(f"✓ Startup type for {service_name} set to {start_type.value}")
-                else:
-                    output_widget.append(f"✗ Failed to set startup type: {message}")
+            self.log_line.emit("config", f"Setting startup type for {service_name} to {start_type.value}")
+            
+            if win32service is not None:
+                success, message = self._call_service_native(
+                    service_name, win32service.SERVICE_CHANGE_CONFIG,
+                    lambda handle: win32service.ChangeServiceConfig(
+                        handle, win32service.SERVICE_NO_CHANGE, native_start_type,
+                        win32service.SERVICE_NO_CHANGE, None, None, False, None, None, None, None
+                    )
+                )
+            else:
+                success, message = self._run_service_cmdlet(
+                    f"Set-Service -Name {powershell_quote(service_name)} "
+                    f"-StartupType {self._START_TYPE_POWERSHELL[start_type]}",
+                    timeout=15
+                )
+            if success:
+                self.invalidate_service(service_name)
+                self.log_line.emit("config", f"✓ Startup type for {service_name} set to {start_type.value}")
+            else:
+                self.log_line.emit("config", f"✗ Failed to set startup type: {message}")
             
             return success
             
         except Exception as e:
             error_msg = f"Error setting startup type for {service_name}: {str(e)}"
-            if output_widget:
-                output_widget.append(f"✗ {error_msg}")
+            self.log_line.emit("config", f"✗ {error_msg}")
             return False
 
+def powershell_quote(value: str) -> str:
+    """Quote a value as a PowerShell single-quoted string literal"""
+    return "'" + value.replace("'", "''") + "'"
+
+class ServiceStatusNotifier:
+    """Subscribes to SCM state change notifications for a set of services
+    
+    Notifications are delivered as APCs to the creating thread, so wait()
+    must be called from that thread. wake() may be called from any thread.
+    """
+    
+    def __init__(self, service_names):
+        self._scm = _advapi32.OpenSCManagerW(None, None, SC_MANAGER_CONNECT)
+        if not self._scm:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._wake_event = _kernel32.CreateEventW(None, False, False, None)
+        self._callback = PFN_SC_NOTIFY_CALLBACK(self._on_notify)
+        
+        # (service handle, SERVICE_NOTIFYW); the structures must outlive their registration
+        self._subscriptions = []
+        self._fired = []
+        for service_name in service_names:
+            handle = _advapi32.OpenServiceW(self._scm, service_name, SERVICE_QUERY_STATUS)
+            if not handle:
+                continue  # Service not installed
+            notify = SERVICE_NOTIFYW(
+                dwVersion=SERVICE_NOTIFY_STATUS_CHANGE,
+                pfnNotifyCallback=self._callback,
+                pContext=len(self._subscriptions)
+            )
+            self._fired.append(len(self._subscriptions))
+            self._subscriptions.append((handle, notify))
+        self._rearm()
+    
+    def _on_notify(self, parameter):
+        notify = SERVICE_NOTIFYW.from_address(parameter)
+        self._fired.append(notify.pContext or 0)
+    
+    def _rearm(self):
+        """Register again for every notification that fired; each one fires once"""
+        fired, self._fired = self._fired, []
+        for index in fired:
+            handle, notify = self._subscriptions[index]
+            # The callback is queued at once if the service is already in a
+            # requested state, so leave out the state it was last seen in
+            mask = SERVICE_NOTIFY_ALL_STATES
+            if notify.ServiceStatus.dwCurrentState:
+                mask &= ~(1 << (notify.ServiceStatus.dwCurrentState - 1))
+            # A service that cannot be watched is still covered by the fallback poll
+            _advapi32.NotifyServiceStatusChangeW(handle, mask, ctypes.byref(notify))
+    
+    def wait(self, timeout: float) -> bool:
+        """Wait for a state change or wake(); False if the timeout expired first"""
+        result = _kernel32.WaitForSingleObjectEx(self._wake_event, int(timeout * 1000), True)
+        self._rearm()
+        return result in (WAIT_OBJECT_0, WAIT_IO_COMPLETION)
+    
+    def wake(self):
+        """End the current wait early"""
+        _kernel32.SetEvent(self._wake_event)
+    
+    def close(self):
+        for handle, _ in self._subscriptions:
+            _advapi32.CloseServiceHandle(handle)
+        self._subscriptions = []
+        _advapi32.CloseServiceHandle(self._scm)
+        _kernel32.CloseHandle(self._wake_event)
+
 class ServiceMonitorThread(QThread):
-    """Thread for monitoring service status changes"""
+    """Thread for monitoring service status changes
+    
+    On Windows the thread sleeps until the SCM reports a state change and
+    only polls every FALLBACK_POLL_INTERVAL as a safety net; elsewhere, or if
+    subscribing fails, it polls every update_interval.
+    """
     services_updated = Signal(dict)  # Dict[str, ServiceInfo]
     
+    FALLBACK_POLL_INTERVAL = 60  # seconds
+    
     def __init__(self, services_manager: ServicesManager):
         super().__init__()
         self.services_manager = services_manager
         self.running = False
         self.update_interval = 5  # seconds
+        # Set by stop() and request_immediate_poll() to end the wait between polls
+        self._wake = threading.Event()
+        self._notifier: Optional[ServiceStatusNotifier] = None
     
     def run(self):
         self.running = True
-        while self.running:
-            try:
-                services = self.services_manager.get_all_important_services()
-                self.services_updated.emit(services)
-                
-                # Sleep in small intervals to allow for quick shutdown
-                for _ in range(self.update_interval * 10):
-                    if not self.running:
-                        break
-                    self.msleep(100)
+        notifier = self._create_notifier()
+        try:
+            while self.running:
+                try:
+                    self._wake.clear()
+                    services = self.services_manager.get_all_important_services()
+                    self.services_updated.emit(services)
                     
-            except Exception as e:
-                print(f"Error in service monitor thread: {e}")
-                self.msleep(1000)
+                    # Block until a service changes, the next poll is due, or until woken early
+                    if notifier is not None:
+                        notifier.wait(self.FALLBACK_POLL_INTERVAL)
+                    else:
+                        self._wake.wait(timeout=self.update_interval)
+                        
+                except Exception as e:
+                    _log_throttled("monitor", f"Error in service monitor thread: {e}")
+                    self._wake.wait(timeout=1)
+        finally:
+            self._notifier = None
+            if notifier is not None:
+                notifier.close()
+    
+    def _create_notifier(self) -> Optional[ServiceStatusNotifier]:
+        """Subscribe to SCM notifications, or return None to poll instead"""
+        if _advapi32 is None:
+            return None
+        try:
+            self._notifier = ServiceStatusNotifier(self.services_manager.important_services)
+        except OSError as e:
+            _log_throttled("notify", f"Service change notifications unavailable: {e}")
+        return self._notifier
+    
+    def request_immediate_poll(self):
+        """Cut the current wait short so services are polled right away"""
+        self._wake.set()
+        notifier = self._notifier
+        if notifier is not None:
+            notifier.wake()
     
     def stop(self):
         self.running = False
+        self.request_immediate_poll()
         self.wait(3000)  # Wait up to 3 seconds for thread to finish
+        self.services_manager.close()
+
+class ServiceListThread(QThread):
+    """Thread for loading the important services sorted by display name"""
+    services_loaded = Signal(list)  # List[ServiceInfo]
+    error_occurred = Signal(str)
+    
+    def __init__(self, services_manager: ServicesManager):
+        super().__init__()
+        self.services_manager = services_manager
+    
+    def run(self):
+        try:
+            services = self.services_manager.get_all_important_services()
+            self.services_loaded.emit(sort_services_by_display_name(services))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+class ServiceRestartThread(QThread):
+    """Thread for restarting a service so waiting for it to stop never blocks the GUI"""
+    
+    def __init__(self, services_manager: ServicesManager, service_name: str):
+        super().__init__()
+        self.services_manager = services_manager
+        self.service_name = service_name
+    
+    def run(self):
+        # Progress and the result arrive through log_line and operation_completed
+        self.services_manager.restart_service(self.service_name)
+
+def sort_services_by_display_name(services: Dict[str, ServiceInfo]) -> List[ServiceInfo]:
+    """Sort services by display name, falling back to the service name"""
+    return sorted(services.values(), key=lambda info: info.display_name or info.name)
@@ -10,6 +10,7 @@ setup(
         "PySide6>=6.5.0",
         "psutil>=5.9.0",
         "pywin32>=306",
+        "nvidia-ml-py>=12.535.0",
     ],
     entry_points={
         'console_scripts': [
@@ -1,14 +1,88 @@
+import asyncio
+import base64
+import codecs
+import ctypes
+import locale
+import re
+import shlex
 import subprocess
 import threading
+import time
+import uuid
 import queue
-import os
-from PySide6.QtCore import QThread, Signal
+import psutil
+from PySide6.QtCore import QObject, Signal, QTimer
 
-class SystemCommandRunner(QThread):
+# Bytes requested per pipe read; a read returns whatever is available
+READ_CHUNK_SIZE = 65536
+
+# Queued output is written to the widget at ~30 Hz
+OUTPUT_FLUSH_INTERVAL_MS = 33
+
+# DISM progress bars look like "[=====    55.0%    ]" or "[=====  ] 55.0%"
+_DISM_PROGRESS = re.compile(rb'\[[=\s]*\]?\s*(\d+(?:\.\d+)?)%')
+
+# Elevation cannot change during the process lifetime, so check it once
+try:
+    _IS_ADMIN = bool(ctypes.windll.shell32.IsUserAnAdmin())
+except (AttributeError, OSError):
+    _IS_ADMIN = False
+
+_event_loop = None
+_event_loop_lock = threading.Lock()
+
+def get_event_loop():
+    """Return the asyncio loop shared by all command runners, starting it on first use
+    
+    One thread multiplexes the pipes of every running command; on Windows the
+    default loop is the ProactorEventLoop, which reads pipes with overlapped I/O.
+    """
+    global _event_loop
+    with _event_loop_lock:
+        if _event_loop is None:
+            _event_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_event_loop.run_forever, name="CommandRunnerLoop", daemon=True
+            ).start()
+        return _event_loop
+
+def decode_output(data: bytes) -> str:
+    """Decode process output with the same encoding text-mode pipes would use"""
+    return data.decode(locale.getpreferredencoding(False), errors='replace')
+
+def build_argv(command, arguments):
+    """Build an argument list for running command directly, without cmd.exe
+    
+    arguments may already be a list, or a command-line string that is split
+    with Windows quoting rules.
+    """
+    if isinstance(arguments, str):
+        arguments = shlex.split(arguments, posix=False)
+    return [command, *arguments]
+
+class OutputLineSplitter:
+    """Decode raw output chunks and split them into complete lines"""
+    
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors='replace')
+        self._pending = ""
+    
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        text = self._pending + self._decoder.decode(chunk, final=final)
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        self._pending = lines.pop()
+        if final and self._pending:
+            lines.append(self._pending)
+            self._pending = ""
+        return lines
+
+class SystemCommandRunner(QObject):
     output_received = Signal(str)
     error_received = Signal(str)
     finished = Signal()
     
+    FLUSH_INTERVAL_MS = OUTPUT_FLUSH_INTERVAL_MS
+    
     def __init__(self, command, arguments, output_widget):
         super().__init__()
         self.command = command
@@ -16,71 +90,119 @@ class SystemCommandRunner(QThread):
         self.output_widget = output_widget
         self.process = None
         self.should_stop = False
+        self._loop = get_event_loop()
+        
+        # Output lines queued by the loop thread, drained by the GUI thread
+        self._pending_output = queue.Queue()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush_output)
         
         # Connect signals
         self.output_received.connect(self.append_output)
         self.error_received.connect(self.append_error)
+        self.finished.connect(self._on_run_finished)
     
-    def run(self):
+    def start(self):
+        """Schedule the command on the shared runner loop"""
+        self._flush_timer.start()
+        asyncio.run_coroutine_threadsafe(self._arun(), self._loop)
+    
+    async def _arun(self):
         try:
-            # Create the full command
-            full_command = f"{self.command} {self.arguments}"
+            # Build the argument list; the tool is started directly, not through cmd.exe
+            argv = build_argv(self.command, self.arguments)
             
             # Start the process with elevated privileges and hidden window
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             startupinfo.wShowWindow = subprocess.SW_HIDE
             
-            self.process = subprocess.Popen(
-                full_command,
-                shell=True,
+            self.process = await asyncio.create_subprocess_exec(
+                *argv,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
                 startupinfo=startupinfo,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
+            if self.should_stop:
+                self.process.terminate()
             
-            # Read output in real-time
+            # Read output as it arrives, queueing whole chunks for the GUI thread
+            splitter = OutputLineSplitter()
             while True:
-                if self.should_stop:
-                    self.process.terminate()
-                    break
-                
-                output = self.process.stdout.readline()
-                if output:
-                    self.output_received.emit(output.strip())
-                elif self.process.poll() is not None:
+                chunk = await self.process.stdout.read(READ_CHUNK_SIZE)
+                lines = splitter.feed(chunk, final=not chunk)
+                if lines:
+                    self._pending_output.put(lines)
+                if not chunk:
                     break
+                self._on_chunk(chunk)
             
-            # Get any remaining output
-            remaining_output, remaining_error = self.process.communicate()
-            if remaining_output:
-                self.output_received.emit(remaining_output.strip())
+            # Get any remaining error output
+            remaining_error = await self.process.stderr.read()
+            await self.process.wait()
             if remaining_error:
-                self.error_received.emit(remaining_error.strip())
+                self.error_received.emit(decode_output(remaining_error).strip())
             
             # Emit completion signal
             exit_code = self.process.returncode
-            self.output_received.emit(f"\nProcess completed with exit code: {exit_code}")
+            self.output_received.emit(f"\n{self._completed_message(exit_code)}")
             
         except Exception as e:
-            self.error_received.emit(f"Error running command: {str(e)}")
+            self.error_received.emit(f"{self._error_prefix()}: {str(e)}")
         finally:
             self.finished.emit()
     
+    def _on_chunk(self, chunk):
+        """Hook called on the loop thread for each raw stdout chunk"""
+    
+    def _completed_message(self, exit_code):
+        return f"Process completed with exit code: {exit_code}"
+    
+    def _error_prefix(self):
+        return "Error running command"
+    
     def stop(self):
         self.should_stop = True
-        if self.process:
+        self._loop.call_soon_threadsafe(self._terminate_process)
+    
+    def _terminate_process(self):
+        if self.process and self.process.returncode is None:
             try:
                 self.process.terminate()
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
+            except ProcessLookupError:
+                pass
+    
+    def flush_output(self):
+        """Append all queued output lines to the widget in one call"""
+        lines = []
+        while True:
+            try:
+                lines.extend(self._pending_output.get_nowait())
+            except queue.Empty:
+                break
+        
+        text = "\n".join(line.strip() for line in lines if line.strip())
+        if text:
+            # Lay out and repaint once for the whole batch
+            self.output_widget.setUpdatesEnabled(False)
+            try:
+                self.output_widget.append(text)
+                # Auto-scroll to bottom
+                cursor = self.output_widget.textCursor()
+                cursor.movePosition(cursor.MoveOperation.End)
+                self.output_widget.setTextCursor(cursor)
+            finally:
+                self.output_widget.setUpdatesEnabled(True)
+    
+    def _on_run_finished(self):
+        self._flush_timer.stop()
+        self.flush_output()
     
     def append_output(self, text):
+        # Keep queued process output ahead of this message
+        self.flush_output()
         if text.strip():
             self.output_widget.append(text)
             # Auto-scroll to bottom
@@ -89,148 +211,62 @@ class SystemCommandRunner(QThread):
             self.output_widget.setTextCursor(cursor)
     
     def append_error(self, text):
+        self.flush_output()
         if text.strip():
             self.output_widget.append(f"ERROR: {text}")
             cursor = self.output_widget.textCursor()
             cursor.movePosition(cursor.MoveOperation.End)
             self.output_widget.setTextCursor(cursor)
 
-class DismCommandRunner(QThread):
+class DismCommandRunner(SystemCommandRunner):
     """Specialized command runner for DISM operations with progress tracking"""
     
-    output_received = Signal(str)
     progress_update = Signal(int)
-    error_received = Signal(str)
-    finished = Signal()
+    
+    # DISM prints thousands of lines during /restorehealth; flush less often
+    FLUSH_INTERVAL_MS = 100
     
     def __init__(self, command, arguments, output_widget):
-        super().__init__()
-        self.command = command
-        self.arguments = arguments
-        self.output_widget = output_widget
-        self.process = None
-        self.should_stop = False
-        
-        # Connect signals
-        self.output_received.connect(self.append_output)
-        self.error_received.connect(self.append_error)
+        super().__init__(command, arguments, output_widget)
         self.progress_update.connect(self.update_progress)
     
-    def run(self):
-        try:
-            # Create the full command
-            full_command = f"{self.command} {self.arguments}"
-            
-            # Start the process with elevated privileges and hidden window
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            self.process = subprocess.Popen(
-                full_command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
-                startupinfo=startupinfo,
-                creationflags=subprocess.CREATE_NO_WINDOW
-            )
-            
-            # Read output in real-time
-            while True:
-                if self.should_stop:
-                    self.process.terminate()
-                    break
-                
-                output = self.process.stdout.readline()
-                if output:
-                    line = output.strip()
-                    self.output_received.emit(line)
-                    
-                    # Try to extract progress from DISM output
-                    progress = self._extract_dism_progress(line)
-                    if progress is not None:
-                        self.progress_update.emit(progress)
-                        
-                elif self.process.poll() is not None:
-                    break
-            
-            # Get any remaining output
-            remaining_output, remaining_error = self.process.communicate()
-            if remaining_output:
-                self.output_received.emit(remaining_output.strip())
-            if remaining_error:
-                self.error_received.emit(remaining_error.strip())
-            
-            # Emit completion signal
-            exit_code = self.process.returncode
-            self.output_received.emit(f"\nDISM process completed with exit code: {exit_code}")
-            
-        except Exception as e:
-            self.error_received.emit(f"Error running DISM command: {str(e)}")
-        finally:
-            self.finished.emit()
-    
-    def _extract_dism_progress(self, line):
-        """Extract progress percentage from DISM output"""
-        try:
-            # DISM shows progress like "[===========     ] 55.0%"
-            if '%' in line and '[' in line:
-                # Find the percentage
-                percent_pos = line.find('%')
-                if percent_pos > 0:
-                    # Look backwards for the number
-                    start = percent_pos - 1
-                    while start >= 0 and (line[start].isdigit() or line[start] == '.'):
-                        start -= 1
-                    
-                    if start < percent_pos - 1:
-                        percent_str = line[start + 1:percent_pos]
-                        return int(float(percent_str))
-            
-            return None
-            
-        except (ValueError, IndexError):
-            return None
+    def _on_chunk(self, chunk):
+        # Try to extract progress from the raw DISM output
+        progress = self._extract_dism_progress(chunk)
+        if progress is not None:
+            self.progress_update.emit(progress)
     
-    def stop(self):
-        self.should_stop = True
-        if self.process:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
+    def _completed_message(self, exit_code):
+        return f"DISM process completed with exit code: {exit_code}"
     
-    def append_output(self, text):
-        if text.strip():
-            self.output_widget.append(text)
-            cursor = self.output_widget.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            self.output_widget.setTextCursor(cursor)
+    def _error_prefix(self):
+        return "Error running DISM command"
     
-    def append_error(self, text):
-        if text.strip():
-            self.output_widget.append(f"ERROR: {text}")
-            cursor = self.output_widget.textCursor()
-            cursor.movePosition(cursor.MoveOperation.End)
-            self.output_widget.setTextCursor(cursor)
+    def _extract_dism_progress(self, data):
+        """Extract the latest progress percentage from a chunk of raw DISM output"""
+        matches = _DISM_PROGRESS.findall(data)
+        if not matches:
+            return None
+        
+        # DISM redraws its bar with carriage returns; only the last value matters
+        return int(float(matches[-1]))
     
     def update_progress(self, percentage):
         """Update progress display in output"""
-        self.output_widget.append(f"Progress: {percentage}%")
+        # Batched with the regular output instead of appended on its own
+        self._pending_output.put([f"Progress: {percentage}%"])
 
 class ElevatedCommandRunner:
+    # Lowercased process name -> processes, shared by lookups within PROCESS_SNAPSHOT_TTL
+    PROCESS_SNAPSHOT_TTL = 0.5  # seconds
+    _process_snapshot = None
+    _process_snapshot_time = 0.0
+    
     @staticmethod
     def run_as_admin(command, arguments):
         """Run a command with administrator privileges"""
         try:
-            import ctypes
-            import sys
-            
-            if ctypes.windll.shell32.IsUserAnAdmin():
+            if _IS_ADMIN:
                 # Already running as admin, execute directly with hidden window
                 startupinfo = subprocess.STARTUPINFO()
                 startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
@@ -255,30 +291,49 @@ class ElevatedCommandRunner:
         except Exception as e:
             return 1, "", str(e)
     
-    @staticmethod
-    def is_process_running(process_name):
+    @classmethod
+    def _snapshot(cls):
+        """Get running processes indexed by lowercased name, enumerating at most once per TTL"""
+        now = time.monotonic()
+        if cls._process_snapshot is None or now - cls._process_snapshot_time >= cls.PROCESS_SNAPSHOT_TTL:
+            snapshot = {}
+            for proc in psutil.process_iter(['pid', 'name']):
+                name = proc.info['name']
+                if name:
+                    snapshot.setdefault(name.lower(), []).append(proc)
+            cls._process_snapshot = snapshot
+            cls._process_snapshot_time = now
+        return cls._process_snapshot
+    
+    @classmethod
+    def is_process_running(cls, process_name):
         """Check if a process is currently running"""
         try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'].lower() == process_name.lower():
-                    return True
-            return False
+            return process_name.lower() in cls._snapshot()
         except:
             return False
     
-    @staticmethod
-    def kill_process(process_name):
-        """Terminate a process by name"""
+    @classmethod
+    def kill_process(cls, process_name):
+        """Terminate every process with the given name; True if all of them ended"""
+        # Enumerate afresh; a cached snapshot can list processes that already exited
+        cls._process_snapshot = None
         try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name']):
-                if proc.info['name'].lower() == process_name.lower():
-                    proc.terminate()
-                    proc.wait(timeout=5)
-            return True
+            processes = cls._snapshot().get(process_name.lower(), [])
         except:
             return False
+        
+        success = True
+        for proc in processes:
+            try:
+                proc.terminate()
+                proc.wait(timeout=5)
+            except psutil.NoSuchProcess:
+                continue  # Exited on its own
+            except (psutil.TimeoutExpired, psutil.AccessDenied):
+                success = False
+        cls._process_snapshot = None
+        return success
 
 class SilentCommandRunner:
     """Command runner that executes commands completely silently"""
@@ -369,3 +424,126 @@ class SilentCommandRunner:
                 'stdout': '',
                 'stderr': str(e)
             }
+
+class PowerShellRunspace:
+    """A long-lived powershell.exe that runs scripts sent over stdin
+    
+    Starting PowerShell takes hundreds of milliseconds, so repeated queries
+    reuse one process. Calls are serialised; each script's output is framed
+    by a unique marker line carrying its exit status.
+    """
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def instance(cls) -> "PowerShellRunspace":
+        """Get the process-wide runspace"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._process = None
+        self._lines = None
+    
+    def _ensure_process(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        
+        self._process = subprocess.Popen(
+            ['powershell.exe', '-NoLogo', '-NoProfile', '-NonInteractive',
+             '-ExecutionPolicy', 'Bypass', '-Command', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding='utf-8',
+            errors='replace',
+            startupinfo=startupinfo,
+            creationflags=subprocess.CREATE_NO_WINDOW
+        )
+        
+        # A reader thread lets run() give up on a script that never finishes
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._read_lines, args=(self._process.stdout, self._lines),
+            name="PowerShellRunspaceReader", daemon=True
+        ).start()
+        self._send("[Console]::OutputEncoding = [Text.Encoding]::UTF8")
+    
+    @staticmethod
+    def _read_lines(stream, lines):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+    
+    def _send(self, command: str):
+        self._process.stdin.write(command + "\n")
+        self._process.stdin.flush()
+    
+    def run(self, script: str, timeout: float = 30):
+        """Run a script and return (returncode, stdout, stderr)
+        
+        The script must not call exit, which would end the shared process.
+        Raises subprocess.TimeoutExpired if it does not finish in time.
+        """
+        with self._lock:
+            self._ensure_process()
+            marker = f"__runspace_{uuid.uuid4().hex}__"
+            encoded = base64.b64encode(script.encode('utf-8')).decode('ascii')
+            
+            # Scripts travel base64-encoded so the whole call fits on one stdin line
+            self._send(
+                f"$__sb = [scriptblock]::Create([Text.Encoding]::UTF8.GetString("
+                f"[Convert]::FromBase64String('{encoded}'))); "
+                f"try {{ $__out = @(& $__sb 2>&1) }} catch {{ $__out = @($_) }}; "
+                f"$__err = @($__out | Where-Object {{ $_ -is [Management.Automation.ErrorRecord] }}); "
+                f"$__std = @($__out | Where-Object {{ $_ -isnot [Management.Automation.ErrorRecord] }}); "
+                f"[Console]::Out.Write(($__std | Out-String -Width 4096)); "
+                f"[Console]::Out.WriteLine('{marker}'); "
+                f"[Console]::Out.Write(($__err | Out-String -Width 4096)); "
+                f"[Console]::Out.WriteLine('{marker} ' + [int]($__err.Count -gt 0))"
+            )
+            
+            sections = [[]]
+            deadline = time.monotonic() + timeout
+            while True:
+                try:
+                    line = self._lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    self._kill()
+                    raise subprocess.TimeoutExpired('powershell.exe', timeout)
+                
+                if line is None:
+                    self._process = None
+                    raise RuntimeError("PowerShell runspace exited unexpectedly")
+                if line.startswith(marker):
+                    status = line[len(marker):].strip()
+                    if status:
+                        stdout, stderr = ("".join(section) for section in sections)
+                        return int(status), stdout, stderr
+                    sections.append([])
+                else:
+                    sections[-1].append(line)
+    
+    def _kill(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process = None
+    
+    def close(self):
+        """End the PowerShell process; the next run() starts a new one"""
+        with self._lock:
+            if self._process is not None:
+                try:
+                    self._process.stdin.close()
+                    self._process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    self._process.kill()
+                self._process = None
@@ -3,119 +3,263 @@ System Information GUI Components
 Provides widgets for displaying system information and real-time monitoring
 """
 
+import html
 import os
+import time
 from datetime import datetime
 from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QProgressBar, QTableWidget, QTableWidgetItem,
-                               QGroupBox, QGridLayout, QPushButton, QTextEdit,
-                               QSplitter, QFrame, QScrollArea, QCheckBox)
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QFont, QPalette, QColor
+                               QProgressBar, QTableView,
+                               QGroupBox, QPushButton, QTextEdit,
+                               QSplitter, QFrame, QCheckBox)
+from PySide6.QtCore import Qt, QTimer, Signal, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QFont, QPalette, QColor, QBrush
 
 from system_info_manager import (SystemInfoManager, SystemInfo, SystemMetrics, 
-                                SystemMonitorThread, format_bytes, format_uptime)
+                                SystemMonitorThread, SystemInfoWorker, MetricsWorker,
+                                read_metrics_counters, format_bytes, format_uptime)
+
+# Bound formatters for the labels refreshed on every monitor tick
+_PCT = "{:.1f}%".format
+_RAM_DETAILS = "{:.1f} GB / {:.1f} GB".format
+_GPU_MEMORY = "Memory: {:.1f}%".format
+_MBS_SENT = "Sent: {:.2f} MB/s".format
+_MBS_RECV = "Received: {:.2f} MB/s".format
+_MBS_READ = "Read: {:.2f} MB/s".format
+_MBS_WRITE = "Write: {:.2f} MB/s".format
+_CPU_TEMP = "CPU: {:.1f}°C".format
+
+# Item flags and alignment shared by the read-only disk tables, built once
+_READ_ONLY_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_ALIGN_NUMBER = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+class DiskInfoTableModel(QAbstractTableModel):
+    """Table model for the static per-drive disk information"""
+    
+    HEADERS = ["Drive", "File System", "Total Size", "Used Space", "Free Space"]
+    NUMERIC_COLUMNS = frozenset((2, 3, 4))
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []  # display texts per disk, one per column
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        return _READ_ONLY_FLAGS
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _ALIGN_NUMBER if column in self.NUMERIC_COLUMNS else None
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        
+        return self._rows[index.row()][column]
+    
+    @staticmethod
+    def _disk_row(disk: Dict) -> tuple:
+        """Format a disk dict into its column texts"""
+        return (
+            disk['device'],
+            disk['fstype'],
+            f"{disk['total_gb']:.1f} GB",
+            f"{disk['used_gb']:.1f} GB ({disk['percent_used']:.1f}%)",
+            f"{disk['free_gb']:.1f} GB",
+        )
+    
+    def set_disks(self, disks: List[Dict]):
+        """Replace the rows with a new list of disk dicts
+        
+        The texts are formatted once here rather than on every paint. When
+        the same drives come back in the same order, only rows whose texts
+        changed are reported; otherwise the model is reset.
+        """
+        rows = [self._disk_row(disk) for disk in disks]
+        if [row[0] for row in rows] != [row[0] for row in self._rows]:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        last_column = len(self.HEADERS) - 1
+        for i, row in enumerate(rows):
+            if row != self._rows[i]:
+                self._rows[i] = row
+                self.dataChanged.emit(self.index(i, 0), self.index(i, last_column))
+
+class DiskUsageTableModel(QAbstractTableModel):
+    """Table model for live per-drive usage percentages"""
+    
+    HEADERS = ["Drive", "Usage %"]
+    
+    # Highlight colors for nearly full drives, allocated once; the view paints
+    # backgrounds with brushes, so hand out ready-made ones
+    _COLOR_RED = QColor(255, 200, 200)  # Light red, above 90%
+    _COLOR_YELLOW = QColor(255, 255, 200)  # Light yellow, above 80%
+    _BRUSH_RED = QBrush(_COLOR_RED)
+    _BRUSH_YELLOW = QBrush(_COLOR_YELLOW)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[tuple] = []  # (drive, usage text, highlight bucket)
+        self._drive_row_index: Dict[str, int] = {}  # drive -> row, stable across ticks
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        return _READ_ONLY_FLAGS
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        drive, usage_text, bucket = self._rows[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return drive if column == 0 else usage_text
+        elif role == Qt.ItemDataRole.BackgroundRole and column == 1:
+            return (None, self._BRUSH_YELLOW, self._BRUSH_RED)[bucket]
+        elif role == Qt.ItemDataRole.TextAlignmentRole and column == 1:
+            return _ALIGN_NUMBER
+        
+        return None
+    
+    def set_usage(self, disk_usage: Dict[str, float], color_buckets: Dict[str, int]):
+        """Update the rows from new drive -> usage and drive -> highlight mappings
+        
+        The highlight buckets are classified by the producer (see
+        SystemMetrics.disk_color_bucket); here they only pick a brush.
+        
+        Only the delta is applied: rows are removed or appended for drives
+        that disappeared or appeared, and an existing row is reported
+        changed only if its printed value or highlight changed. Known
+        drives keep their row, so a producer that rebuilds the mapping in a
+        different order does not make every row look changed.
+        """
+        # Remove rows bottom-up so the remaining row numbers stay valid
+        removed = False
+        for row in range(len(self._rows) - 1, -1, -1):
+            if self._rows[row][0] not in disk_usage:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+                removed = True
+        if removed:
+            self._drive_row_index = {row[0]: i for i, row in enumerate(self._rows)}
+        
+        # Update the drives already shown, in row order
+        for drive, row in self._drive_row_index.items():
+            usage = disk_usage[drive]
+            new_row = (drive, _PCT(usage), color_buckets.get(drive, 0))
+            if self._rows[row] != new_row:
+                self._rows[row] = new_row
+                index = self.index(row, 1)
+                self.dataChanged.emit(index, index)
+        
+        # Newly seen drives are appended after the existing rows
+        new_drives = [drive for drive in disk_usage if drive not in self._drive_row_index]
+        if new_drives:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(new_drives) - 1)
+            for drive in new_drives:
+                usage = disk_usage[drive]
+                self._drive_row_index[drive] = len(self._rows)
+                self._rows.append((drive, _PCT(usage), color_buckets.get(drive, 0)))
+            self.endInsertRows()
+
+def info_rows_html(captions: List[str], values: Optional[List[str]] = None) -> str:
+    """Render caption/value pairs as an aligned rich-text table
+    
+    Values default to "Loading..." and are HTML-escaped; newlines in a value
+    become line breaks.
+    """
+    if values is None:
+        values = ["Loading..."] * len(captions)
+    rows = "".join(
+        f"<tr><td style='padding-right: 12px'>{caption}</td>"
+        f"<td>{html.escape(str(value)).replace(chr(10), '<br>')}</td></tr>"
+        for caption, value in zip(captions, values)
+    )
+    return f"<table>{rows}</table>"
 
 class SystemInfoWidget(QWidget):
     """Widget for displaying static system information"""
     
-    def __init__(self):
+    WINDOWS_ROWS = ["Version:", "Build:", "Edition:", "Last Update:", "Update Package:"]
+    SYSTEM_ROWS = ["Computer Name:", "User Name:", "System Uptime:", "Motherboard:", "BIOS:"]
+    HARDWARE_ROWS = ["CPU Model:", "CPU Cores/Threads:", "Total RAM:", "Graphics Cards:", "NVIDIA Driver:"]
+    
+    def __init__(self, system_info_manager: SystemInfoManager):
         super().__init__()
-        self.system_info_manager = SystemInfoManager()
+        self.system_info_manager = system_info_manager
+        self.info_worker = None
+        # Info received while hidden, applied on the next showEvent
+        self._pending_info: Optional[SystemInfo] = None
         self.setup_ui()
+        # Results arrive from the worker thread, queued onto the GUI thread
+        self.system_info_manager.info_collected.connect(self.update_display)
         self.load_system_info()
     
     def setup_ui(self):
+        # The groups are laid out directly on the widget; the content is small
+        # and the disk table scrolls on its own, so no scroll area is needed
         layout = QVBoxLayout(self)
         
-        # Create scroll area for system info
-        scroll_area = QScrollArea()
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        
-        # Windows Information Group
+        # Windows, System and Hardware groups each show one rich-text label,
+        # so a refresh sets three texts instead of fifteen
         windows_group = QGroupBox("Windows Information")
-        windows_layout = QGridLayout(windows_group)
-        
-        self.windows_version_label = QLabel("Loading...")
-        self.windows_build_label = QLabel("Loading...")
-        self.windows_edition_label = QLabel("Loading...")
-        self.last_update_date_label = QLabel("Loading...")
-        self.last_update_package_label = QLabel("Loading...")
-        
-        windows_layout.addWidget(QLabel("Version:"), 0, 0)
-        windows_layout.addWidget(self.windows_version_label, 0, 1)
-        windows_layout.addWidget(QLabel("Build:"), 1, 0)
-        windows_layout.addWidget(self.windows_build_label, 1, 1)
-        windows_layout.addWidget(QLabel("Edition:"), 2, 0)
-        windows_layout.addWidget(self.windows_edition_label, 2, 1)
-        windows_layout.addWidget(QLabel("Last Update:"), 3, 0)
-        windows_layout.addWidget(self.last_update_date_label, 3, 1)
-        windows_layout.addWidget(QLabel("Update Package:"), 4, 0)
-        windows_layout.addWidget(self.last_update_package_label, 4, 1)
-        
-        scroll_layout.addWidget(windows_group)
-        
-        # System Information Group
+        windows_layout = QVBoxLayout(windows_group)
+        self.windows_group_label = QLabel(info_rows_html(self.WINDOWS_ROWS))
+        windows_layout.addWidget(self.windows_group_label)
+        layout.addWidget(windows_group)
+        
         system_group = QGroupBox("System Information")
-        system_layout = QGridLayout(system_group)
-        
-        self.computer_name_label = QLabel("Loading...")
-        self.user_name_label = QLabel("Loading...")
-        self.uptime_label = QLabel("Loading...")
-        self.motherboard_label = QLabel("Loading...")
-        self.bios_label = QLabel("Loading...")
-        
-        system_layout.addWidget(QLabel("Computer Name:"), 0, 0)
-        system_layout.addWidget(self.computer_name_label, 0, 1)
-        system_layout.addWidget(QLabel("User Name:"), 1, 0)
-        system_layout.addWidget(self.user_name_label, 1, 1)
-        system_layout.addWidget(QLabel("System Uptime:"), 2, 0)
-        system_layout.addWidget(self.uptime_label, 2, 1)
-        system_layout.addWidget(QLabel("Motherboard:"), 3, 0)
-        system_layout.addWidget(self.motherboard_label, 3, 1)
-        system_layout.addWidget(QLabel("BIOS:"), 4, 0)
-        system_layout.addWidget(self.bios_label, 4, 1)
-        
-        scroll_layout.addWidget(system_group)
-        
-        # Hardware Information Group
+        system_layout = QVBoxLayout(system_group)
+        self.system_group_label = QLabel(info_rows_html(self.SYSTEM_ROWS))
+        system_layout.addWidget(self.system_group_label)
+        layout.addWidget(system_group)
+        
         hardware_group = QGroupBox("Hardware Information")
-        hardware_layout = QGridLayout(hardware_group)
-        
-        self.cpu_model_label = QLabel("Loading...")
-        self.cpu_cores_label = QLabel("Loading...")
-        self.total_ram_label = QLabel("Loading...")
-        self.gpu_info_label = QLabel("Loading...")
-        self.nvidia_driver_label = QLabel("Loading...")
-        
-        hardware_layout.addWidget(QLabel("CPU Model:"), 0, 0)
-        hardware_layout.addWidget(self.cpu_model_label, 0, 1)
-        hardware_layout.addWidget(QLabel("CPU Cores/Threads:"), 1, 0)
-        hardware_layout.addWidget(self.cpu_cores_label, 1, 1)
-        hardware_layout.addWidget(QLabel("Total RAM:"), 2, 0)
-        hardware_layout.addWidget(self.total_ram_label, 2, 1)
-        hardware_layout.addWidget(QLabel("Graphics Cards:"), 3, 0)
-        hardware_layout.addWidget(self.gpu_info_label, 3, 1)
-        hardware_layout.addWidget(QLabel("NVIDIA Driver:"), 4, 0)
-        hardware_layout.addWidget(self.nvidia_driver_label, 4, 1)
-        
-        scroll_layout.addWidget(hardware_group)
+        hardware_layout = QVBoxLayout(hardware_group)
+        self.hardware_group_label = QLabel(info_rows_html(self.HARDWARE_ROWS))
+        hardware_layout.addWidget(self.hardware_group_label)
+        layout.addWidget(hardware_group)
         
         # Disk Information Group
         disk_group = QGroupBox("Disk Information")
         disk_layout = QVBoxLayout(disk_group)
         
-        self.disk_table = QTableWidget()
-        self.disk_table.setColumnCount(5)
-        self.disk_table.setHorizontalHeaderLabels([
-            "Drive", "File System", "Total Size", "Used Space", "Free Space"
-        ])
+        self.disk_model = DiskInfoTableModel(self)
+        self.disk_table = QTableView()
+        self.disk_table.setModel(self.disk_model)
         self.disk_table.horizontalHeader().setStretchLastSection(True)
         
         disk_layout.addWidget(self.disk_table)
-        scroll_layout.addWidget(disk_group)
+        layout.addWidget(disk_group)
         
         # Refresh button
         refresh_layout = QHBoxLayout()
@@ -125,71 +269,96 @@ class SystemInfoWidget(QWidget):
         self.refresh_btn.clicked.connect(self.load_system_info)
         refresh_layout.addWidget(self.refresh_btn)
         
-        scroll_layout.addLayout(refresh_layout)
-        
-        scroll_widget.setLayout(scroll_layout)
-        scroll_area.setWidget(scroll_widget)
-        scroll_area.setWidgetResizable(True)
-        
-        layout.addWidget(scroll_area)
+        layout.addLayout(refresh_layout)
     
     def load_system_info(self):
-        """Load and display system information"""
+        """Load system information in the background and display it when ready"""
+        if self.info_worker is not None and self.info_worker.isRunning():
+            return
+        
         self.refresh_btn.setEnabled(False)
         self.refresh_btn.setText("Loading...")
         
-        try:
-            system_info = self.system_info_manager.get_complete_system_info()
+        self.info_worker = SystemInfoWorker(self.system_info_manager)
+        self.info_worker.finished.connect(self.on_load_finished)
+        self.info_worker.start()
+    
+    def on_load_finished(self):
+        """Re-enable refreshing once the background load is done"""
+        self.refresh_btn.setEnabled(True)
+        self.refresh_btn.setText("Refresh System Information")
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_info is not None:
+            system_info, self._pending_info = self._pending_info, None
             self.update_display(system_info)
-        except Exception as e:
-            print(f"Error loading system info: {e}")
-        finally:
-            self.refresh_btn.setEnabled(True)
-            self.refresh_btn.setText("Refresh System Information")
     
     def update_display(self, system_info: SystemInfo):
         """Update the display with system information"""
+        if not self.isVisible():
+            self._pending_info = system_info
+            return
+        
         # Windows Information
-        self.windows_version_label.setText(system_info.windows_version)
-        self.windows_build_label.setText(system_info.windows_build)
-        self.windows_edition_label.setText(system_info.windows_edition)
-        self.last_update_date_label.setText(system_info.last_update_date)
-        self.last_update_package_label.setText(system_info.last_update_package)
+        self.windows_group_label.setText(info_rows_html(self.WINDOWS_ROWS, [
+            system_info.windows_version,
+            system_info.windows_build,
+            system_info.windows_edition,
+            system_info.last_update_date,
+            system_info.last_update_package,
+        ]))
         
         # System Information
-        self.computer_name_label.setText(system_info.computer_name)
-        self.user_name_label.setText(system_info.user_name)
-        self.uptime_label.setText(system_info.system_uptime)
-        self.motherboard_label.setText(system_info.motherboard)
-        self.bios_label.setText(system_info.bios_version)
+        self.system_group_label.setText(info_rows_html(self.SYSTEM_ROWS, [
+            system_info.computer_name,
+            system_info.user_name,
+            system_info.system_uptime,
+            system_info.motherboard,
+            system_info.bios_version,
+        ]))
         
         # Hardware Information
-        self.cpu_model_label.setText(system_info.cpu_model)
-        self.cpu_cores_label.setText(f"{system_info.cpu_cores} cores / {system_info.cpu_threads} threads")
-        self.total_ram_label.setText(f"{system_info.total_ram_gb:.1f} GB")
-        
-        # GPU Information
-        gpu_text = "\n".join(system_info.gpu_info)
-        self.gpu_info_label.setText(gpu_text)
-        self.nvidia_driver_label.setText(system_info.nvidia_driver_version)
-        
-        # Disk Information
-        self.disk_table.setRowCount(len(system_info.disk_info))
-        for i, disk in enumerate(system_info.disk_info):
-            self.disk_table.setItem(i, 0, QTableWidgetItem(disk['device']))
-            self.disk_table.setItem(i, 1, QTableWidgetItem(disk['fstype']))
-            self.disk_table.setItem(i, 2, QTableWidgetItem(f"{disk['total_gb']:.1f} GB"))
-            self.disk_table.setItem(i, 3, QTableWidgetItem(f"{disk['used_gb']:.1f} GB ({disk['percent_used']:.1f}%)"))
-            self.disk_table.setItem(i, 4, QTableWidgetItem(f"{disk['free_gb']:.1f} GB"))
+        self.hardware_group_label.setText(info_rows_html(self.HARDWARE_ROWS, [
+            system_info.cpu_model,
+            f"{system_info.cpu_cores} cores / {system_info.cpu_threads} threads",
+            f"{system_info.total_ram_gb:.1f} GB",
+            "\n".join(system_info.gpu_info),
+            system_info.nvidia_driver_version,
+        ]))
+        
+        # Disk Information, repainted once after the whole update
+        self.disk_table.setUpdatesEnabled(False)
+        try:
+            self.disk_model.set_disks(system_info.disk_info)
+        finally:
+            self.disk_table.setUpdatesEnabled(True)
 
 class RealTimeMonitorWidget(QWidget):
     """Widget for real-time system monitoring"""
     
-    def __init__(self):
+    # Minimum time between repaints from the monitor thread unless the window has focus
+    PAINT_INTERVAL = 0.5  # seconds
+    
+    def __init__(self, system_info_manager: SystemInfoManager):
         super().__init__()
-        self.system_info_manager = SystemInfoManager()
+        self.system_info_manager = system_info_manager
         self.monitor_thread = None
+        self.refresh_worker = None
+        # Counters of the last manual sample; the monitor thread keeps its own
+        self._refresh_counters = read_metrics_counters()
         self.monitoring_active = False
+        # Latest metrics received while hidden, applied on the next showEvent
+        self._pending_metrics: Optional[SystemMetrics] = None
+        # The first sample is taken when the panel is first shown, not at startup
+        self._initial_refresh_done = False
+        # Newest sample from the monitor thread waiting to be painted
+        self._latest_metrics: Optional[SystemMetrics] = None
+        self._flush_scheduled = False
+        self._last_paint = 0.0
+        # Label -> value last shown on it, so unchanged labels are neither
+        # reformatted nor repainted
+        self._last: Dict[QLabel, object] = {}
         self.setup_ui()
         
     def setup_ui(self):
@@ -247,8 +416,8 @@ class RealTimeMonitorWidget(QWidget):
         left_layout.addWidget(ram_group)
         
         # GPU Usage (NVIDIA only)
-        gpu_group = QGroupBox("GPU Usage (NVIDIA)")
-        gpu_layout = QVBoxLayout(gpu_group)
+        self.gpu_group = QGroupBox("GPU Usage (NVIDIA)")
+        gpu_layout = QVBoxLayout(self.gpu_group)
         
         self.gpu_progress = QProgressBar()
         self.gpu_progress.setRange(0, 100)
@@ -260,7 +429,7 @@ class RealTimeMonitorWidget(QWidget):
         gpu_layout.addWidget(self.gpu_progress)
         gpu_layout.addWidget(self.gpu_label)
         gpu_layout.addWidget(self.gpu_memory_label)
-        left_layout.addWidget(gpu_group)
+        left_layout.addWidget(self.gpu_group)
         
         left_layout.addStretch()
         metrics_splitter.addWidget(left_panel)
@@ -273,9 +442,9 @@ class RealTimeMonitorWidget(QWidget):
         disk_group = QGroupBox("Disk Usage")
         disk_layout = QVBoxLayout(disk_group)
         
-        self.disk_table = QTableWidget()
-        self.disk_table.setColumnCount(2)
-        self.disk_table.setHorizontalHeaderLabels(["Drive", "Usage %"])
+        self.disk_model = DiskUsageTableModel(self)
+        self.disk_table = QTableView()
+        self.disk_table.setModel(self.disk_model)
         self.disk_table.horizontalHeader().setStretchLastSection(True)
         
         disk_layout.addWidget(self.disk_table)
@@ -292,6 +461,17 @@ class RealTimeMonitorWidget(QWidget):
         network_layout.addWidget(self.network_recv_label)
         right_layout.addWidget(network_group)
         
+        # Disk Activity
+        disk_activity_group = QGroupBox("Disk Activity")
+        disk_activity_layout = QVBoxLayout(disk_activity_group)
+        
+        self.disk_read_label = QLabel("Read: 0 MB/s")
+        self.disk_write_label = QLabel("Write: 0 MB/s")
+        
+        disk_activity_layout.addWidget(self.disk_read_label)
+        disk_activity_layout.addWidget(self.disk_write_label)
+        right_layout.addWidget(disk_activity_group)
+        
         # Temperature (if available)
         temp_group = QGroupBox("Temperature")
         temp_layout = QVBoxLayout(temp_group)
@@ -318,9 +498,6 @@ class RealTimeMonitorWidget(QWidget):
         # Set splitter proportions
         metrics_splitter.setSizes([300, 400])
         layout.addWidget(metrics_splitter)
-        
-        # Initial refresh
-        self.manual_refresh()
     
     def toggle_monitoring(self, enabled: bool):
         """Toggle real-time monitoring"""
@@ -334,7 +511,9 @@ class RealTimeMonitorWidget(QWidget):
         if not self.monitoring_active:
             self.monitoring_active = True
             self.monitor_thread = SystemMonitorThread(self.system_info_manager)
-            self.monitor_thread.metrics_updated.connect(self.update_metrics)
+            self.monitor_thread.metrics_updated.connect(self._queue_metrics)
+            if not self.isVisible():
+                self.monitor_thread.pause()
             self.monitor_thread.start()
             self.monitoring_status_label.setText("Monitoring: Active")
     
@@ -348,53 +527,129 @@ class RealTimeMonitorWidget(QWidget):
             self.monitoring_status_label.setText("Monitoring: Stopped")
     
     def manual_refresh(self):
-        """Manually refresh metrics"""
-        try:
-            metrics = self.system_info_manager.get_real_time_metrics()
+        """Take a metrics sample in the background; clicks during a fetch are ignored"""
+        if self.refresh_worker is not None and self.refresh_worker.isRunning():
+            return
+        
+        self.manual_refresh_btn.setEnabled(False)
+        
+        self.refresh_worker = MetricsWorker(self.system_info_manager, self._refresh_counters)
+        self.refresh_worker.finished_with_metrics.connect(self.on_refresh_metrics)
+        self.refresh_worker.error_occurred.connect(self.on_refresh_error)
+        self.refresh_worker.finished.connect(self.on_refresh_finished)
+        self.refresh_worker.start()
+    
+    def on_refresh_metrics(self, metrics: SystemMetrics):
+        """Show a manual sample and keep its counters as the next baseline"""
+        if metrics.counters is not None:
+            self._refresh_counters = metrics.counters
+        self.update_metrics(metrics)
+    
+    def on_refresh_error(self, error: str):
+        """Show a failed background sample in the status panel"""
+        self.last_update_label.setText(error)
+    
+    def on_refresh_finished(self):
+        """Re-enable manual refresh once the background sample is done"""
+        self.manual_refresh_btn.setEnabled(True)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.monitor_thread:
+            self.monitor_thread.resume()
+        if not self._initial_refresh_done:
+            self._initial_refresh_done = True
+            self.manual_refresh()
+        elif self._pending_metrics is not None:
+            metrics, self._pending_metrics = self._pending_metrics, None
             self.update_metrics(metrics)
-        except Exception as e:
-            print(f"Error during manual refresh: {e}")
+    
+    def hideEvent(self, event):
+        """Pause sampling while hidden; the thread is kept for the next show"""
+        super().hideEvent(event)
+        if self.monitor_thread:
+            self.monitor_thread.pause()
+    
+    def _queue_metrics(self, metrics: SystemMetrics):
+        """Keep the newest sample and schedule a repaint for it"""
+        self._latest_metrics = metrics
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_metrics)
+    
+    def _flush_metrics(self):
+        """Paint the newest sample, at most once per PAINT_INTERVAL unless focused"""
+        self._flush_scheduled = False
+        if self._latest_metrics is None:
+            return
+        
+        elapsed = time.monotonic() - self._last_paint
+        if self.isActiveWindow() or elapsed >= self.PAINT_INTERVAL:
+            metrics, self._latest_metrics = self._latest_metrics, None
+            self._last_paint = time.monotonic()
+            self.update_metrics(metrics)
+        else:
+            # Samples arriving meanwhile replace this one; only the newest is painted
+            self._flush_scheduled = True
+            QTimer.singleShot(int((self.PAINT_INTERVAL - elapsed) * 1000), self._flush_metrics)
     
     def update_metrics(self, metrics: SystemMetrics):
         """Update the display with new metrics"""
+        if not self.isVisible():
+            self._pending_metrics = metrics
+            return
+        
         try:
             # CPU Usage
-            self.cpu_progress.setValue(int(metrics.cpu_usage))
-            self.cpu_label.setText(f"{metrics.cpu_usage:.1f}%")
+            self._set_progress(self.cpu_progress, int(metrics.cpu_usage))
+            if self._changed(self.cpu_label, metrics.cpu_usage):
+                self.cpu_label.setText(_PCT(metrics.cpu_usage))
             
             # RAM Usage
-            self.ram_progress.setValue(int(metrics.ram_usage))
-            self.ram_label.setText(f"{metrics.ram_usage:.1f}%")
-            self.ram_details_label.setText(f"{metrics.ram_used_gb:.1f} GB / {metrics.ram_used_gb + metrics.ram_available_gb:.1f} GB")
+            self._set_progress(self.ram_progress, int(metrics.ram_usage))
+            if self._changed(self.ram_label, metrics.ram_usage):
+                self.ram_label.setText(_PCT(metrics.ram_usage))
+            ram_total = metrics.ram_used_gb + metrics.ram_available_gb
+            if self._changed(self.ram_details_label, (metrics.ram_used_gb, ram_total)):
+                self.ram_details_label.setText(_RAM_DETAILS(metrics.ram_used_gb, ram_total))
             
-            # GPU Usage
-            self.gpu_progress.setValue(int(metrics.gpu_usage))
-            self.gpu_label.setText(f"{metrics.gpu_usage:.1f}%")
-            self.gpu_memory_label.setText(f"Memory: {metrics.gpu_memory_usage:.1f}%")
+            # GPU Usage; the group is hidden for good once no NVIDIA GPU was found
+            if metrics.gpu_available:
+                self._set_progress(self.gpu_progress, int(metrics.gpu_usage))
+                if self._changed(self.gpu_label, metrics.gpu_usage):
+                    self.gpu_label.setText(_PCT(metrics.gpu_usage))
+                if self._changed(self.gpu_memory_label, metrics.gpu_memory_usage):
+                    self.gpu_memory_label.setText(_GPU_MEMORY(metrics.gpu_memory_usage))
+            elif not self.gpu_group.isHidden():
+                self.gpu_group.hide()
             
-            # Disk Usage
-            self.disk_table.setRowCount(len(metrics.disk_usage))
-            for i, (drive, usage) in enumerate(metrics.disk_usage.items()):
-                self.disk_table.setItem(i, 0, QTableWidgetItem(drive))
-                
-                # Create progress bar for disk usage
-                usage_item = QTableWidgetItem(f"{usage:.1f}%")
-                if usage > 90:
-                    usage_item.setBackground(QColor(255, 200, 200))  # Light red
-                elif usage > 80:
-                    usage_item.setBackground(QColor(255, 255, 200))  # Light yellow
-                
-                self.disk_table.setItem(i, 1, usage_item)
+            # Disk Usage, repainted once after the whole update
+            self.disk_table.setUpdatesEnabled(False)
+            try:
+                self.disk_model.set_usage(metrics.disk_usage, metrics.disk_color_bucket)
+            finally:
+                self.disk_table.setUpdatesEnabled(True)
             
             # Network Activity
-            self.network_sent_label.setText(f"Sent: {metrics.network_sent_mb:.2f} MB/s")
-            self.network_recv_label.setText(f"Received: {metrics.network_recv_mb:.2f} MB/s")
+            if self._changed(self.network_sent_label, metrics.network_sent_mb):
+                self.network_sent_label.setText(_MBS_SENT(metrics.network_sent_mb))
+            if self._changed(self.network_recv_label, metrics.network_recv_mb):
+                self.network_recv_label.setText(_MBS_RECV(metrics.network_recv_mb))
             
-            # Temperature
-            if metrics.temperature_cpu is not None:
-                self.cpu_temp_label.setText(f"CPU: {metrics.temperature_cpu:.1f}°C")
-            else:
-                self.cpu_temp_label.setText("CPU: Not available")
+            # Disk Activity, summed over the physical disks
+            disk_read_mb = sum(metrics.disk_read_mb.values())
+            disk_write_mb = sum(metrics.disk_write_mb.values())
+            if self._changed(self.disk_read_label, disk_read_mb):
+                self.disk_read_label.setText(_MBS_READ(disk_read_mb))
+            if self._changed(self.disk_write_label, disk_write_mb):
+                self.disk_write_label.setText(_MBS_WRITE(disk_write_mb))
+            
+            # Temperature; without a sensor the label keeps "Not available"
+            if metrics.temperature_available and self._changed(self.cpu_temp_label, metrics.temperature_cpu):
+                if metrics.temperature_cpu is not None:
+                    self.cpu_temp_label.setText(_CPU_TEMP(metrics.temperature_cpu))
+                else:
+                    self.cpu_temp_label.setText("CPU: Not available")
             
             # Last update time
             self.last_update_label.setText(f"Last Update: {metrics.timestamp.strftime('%H:%M:%S')}")
@@ -402,6 +657,19 @@ class RealTimeMonitorWidget(QWidget):
         except Exception as e:
             print(f"Error updating metrics display: {e}")
     
+    def _changed(self, label: QLabel, value) -> bool:
+        """Record the value for a label; True if it differs from the one shown"""
+        if label in self._last and self._last[label] == value:
+            return False
+        self._last[label] = value
+        return True
+    
+    @staticmethod
+    def _set_progress(progress_bar: QProgressBar, value: int):
+        """Set a progress bar's value only if it changed"""
+        if progress_bar.value() != value:
+            progress_bar.setValue(value)
+    
     def closeEvent(self, event):
         """Handle widget close event"""
         self.stop_monitoring()
@@ -420,15 +688,28 @@ class SystemInfoTabWidget(QWidget):
         # Create splitter for two panels
         splitter = QSplitter(Qt.Orientation.Vertical)
         
+        # One manager shared by both panels
+        self.manager = SystemInfoManager()
+        
         # System Information Panel
-        info_widget = SystemInfoWidget()
-        splitter.addWidget(info_widget)
+        self.info_widget = SystemInfoWidget(self.manager)
+        splitter.addWidget(self.info_widget)
         
         # Real-time Monitoring Panel
-        monitor_widget = RealTimeMonitorWidget()
-        splitter.addWidget(monitor_widget)
+        self.monitor_widget = RealTimeMonitorWidget(self.manager)
+        splitter.addWidget(self.monitor_widget)
         
         # Set initial sizes (60% for info, 40% for monitoring)
         splitter.setSizes([600, 400])
         
         layout.addWidget(splitter)
+    
+    def stop_monitoring(self):
+        """Stop the real-time monitor thread and let in-flight background loads finish
+        
+        Called by the main window when the application closes.
+        """
+        self.monitor_widget.stop_monitoring()
+        for worker in (self.monitor_widget.refresh_worker, self.info_widget.info_worker):
+            if worker is not None:
+                worker.wait(3000)  # Same bound as SystemMonitorThread.stop
@@ -3,17 +3,63 @@ System Information Manager
 Handles collection of comprehensive system information and real-time monitoring
 """
 
+import ctypes
+import json
 import os
 import platform
+import re
 import subprocess
+import sys
+import threading
 import psutil
 import time
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, replace
 from PySide6.QtCore import QThread, Signal, QObject
 
-@dataclass
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:  # pywin32 missing, fall back to wmic
+    pythoncom = None
+    win32com = None
+
+try:
+    import win32evtlog
+except ImportError:  # pywin32 missing, fall back to PowerShell
+    win32evtlog = None
+
+try:
+    import pynvml
+except ImportError:  # nvidia-ml-py missing, fall back to nvidia-smi
+    pynvml = None
+
+try:
+    _kernel32 = ctypes.WinDLL('kernel32')
+    _kernel32.GetTickCount64.restype = ctypes.c_ulonglong
+    _kernel32.GetTickCount64.argtypes = []
+except (AttributeError, OSError):  # Not on Windows, uptime comes from psutil
+    _kernel32 = None
+
+# __slots__ for the data classes where dataclass supports it (Python 3.10+);
+# a SystemMetrics is built on every monitor tick
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# KB article number in an update title or message
+_KB_RE = re.compile(r'KB\d+')
+
+# Win32_OperatingSystem.OperatingSystemSKU -> edition name
+SKU_EDITIONS = {
+    '1': 'Ultimate', '2': 'Home Basic', '3': 'Home Premium',
+    '4': 'Enterprise', '6': 'Business', '7': 'Server Standard',
+    '48': 'Professional', '49': 'Enterprise N', '50': 'Enterprise KN',
+    '101': 'Home', '100': 'Home N', '103': 'Professional N'
+}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemInfo:
     """Data class for static system information"""
     # Windows Information
@@ -47,7 +93,17 @@ class SystemInfo:
         if self.disk_info is None:
             self.disk_info = []
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
+class MetricsCounters:
+    """Cumulative counters read at one instant; rates come from two of them"""
+    cpu_times: object
+    # Disk name -> I/O counters
+    disk_io: Dict[str, object]
+    # None when the network counters could not be read
+    net_io: Optional[object]
+    time: float
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SystemMetrics:
     """Data class for real-time system metrics"""
     timestamp: datetime
@@ -58,13 +114,72 @@ class SystemMetrics:
     gpu_usage: float = 0.0
     gpu_memory_usage: float = 0.0
     disk_usage: Dict[str, float] = None
+    # Per-drive highlight bucket: 0 ok, 1 above 80% (yellow), 2 above 90% (red)
+    disk_color_bucket: Dict[str, int] = None
+    # Per physical disk read/write rates in MB/s since the previous sample
+    disk_read_mb: Dict[str, float] = None
+    disk_write_mb: Dict[str, float] = None
     network_sent_mb: float = 0.0
     network_recv_mb: float = 0.0
     temperature_cpu: Optional[float] = None
+    # False once the source was found missing; the value is then never sampled
+    gpu_available: bool = True
+    temperature_available: bool = True
+    # Counters the rates were measured up to; the baseline for the next sample
+    counters: Optional[MetricsCounters] = None
     
     def __post_init__(self):
         if self.disk_usage is None:
             self.disk_usage = {}
+        if self.disk_color_bucket is None:
+            self.disk_color_bucket = {}
+        if self.disk_read_mb is None:
+            self.disk_read_mb = {}
+        if self.disk_write_mb is None:
+            self.disk_write_mb = {}
+
+class NvidiaSmiStream:
+    """nvidia-smi left running in loop mode, used when NVML is unavailable
+    
+    The process prints one CSV line per interval; a reader thread keeps the
+    newest one, so a query costs no process start and never returns a
+    stale buffered line.
+    """
+    
+    def __init__(self, interval_ms: int = 2000):
+        self._process = subprocess.Popen(
+            ['nvidia-smi', '--query-gpu=utilization.gpu,utilization.memory',
+             '--format=csv,noheader,nounits', '-lms', str(interval_ms)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, bufsize=1,
+            # Resident for the app's lifetime, so it must not own a console window
+            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+        )
+        self._latest: Optional[Tuple[float, float]] = None
+        self._first_line = threading.Event()
+        threading.Thread(target=self._read_lines, name="NvidiaSmiReader", daemon=True).start()
+    
+    def _read_lines(self):
+        for line in self._process.stdout:
+            values = line.strip().split(', ')
+            try:
+                self._latest = float(values[0]), float(values[1])
+            except (ValueError, IndexError):
+                continue
+            self._first_line.set()
+        # The process ended; don't keep read() waiting for a first line
+        self._first_line.set()
+    
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+    
+    def read(self, timeout: float = 5.0) -> Optional[Tuple[float, float]]:
+        """Newest (gpu usage, memory usage), waiting for the first line if needed"""
+        self._first_line.wait(timeout)
+        return self._latest
+    
+    def close(self):
+        if self.is_alive():
+            self._process.terminate()
 
 class SystemInfoManager(QObject):
     """Manager for collecting system information and metrics"""
@@ -74,53 +189,160 @@ class SystemInfoManager(QObject):
     metrics_collected = Signal(SystemMetrics)
     error_occurred = Signal(str)
     
+    # Seconds the partition list is reused before it is enumerated again
+    PARTITIONS_TTL = 30.0
+    # Seconds a live disk usage reading is reused; fullness changes slowly and
+    # live disk activity comes from the I/O counters instead
+    DISK_USAGE_TTL = 30.0
+    # Seconds a CPU temperature reading (or its absence) is reused
+    TEMPERATURE_TTL = 30.0
+    
     def __init__(self):
         super().__init__()
-        self.last_network_stats = None
-        self.last_network_time = None
+        # Decided by the first GPU/temperature sample: None until probed,
+        # False if the first one failed, in which case it is never retried
+        self.gpu_available: Optional[bool] = None
+        self.temperature_available: Optional[bool] = None
+        # WMI connections are per thread (COM apartments)
+        self._wmi_local = threading.local()
+        # NVML handle for the first GPU; None without NVML or an NVIDIA GPU
+        self._nvml_handle = self._init_nvml()
+        # Resident nvidia-smi for GPU usage when NVML is unavailable, started on first use
+        self._nvsmi_stream: Optional[NvidiaSmiStream] = None
+        # Last full SystemInfo; hardware and OS fields are reused from it
+        self._cached_info: Optional[SystemInfo] = None
+        self._partitions_cache = None
+        self._partitions_time = 0.0
+        # (drive -> usage percent, monotonic time it was read)
+        self._disk_usage_cache: Optional[Tuple[Dict[str, float], float]] = None
+        # (monotonic time it was read, temperature or None)
+        self._temperature_cache: Optional[Tuple[float, Optional[float]]] = None
+    
+    def __del__(self):
+        if self._nvsmi_stream is not None:
+            self._nvsmi_stream.close()
+        if self._nvml_handle is not None:
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
     
-    def get_complete_system_info(self) -> SystemInfo:
-        """Collect complete static system information"""
+    @staticmethod
+    def _init_nvml():
+        """Initialize NVML and get the first GPU's handle, or None"""
+        if pynvml is None:
+            return None
+        try:
+            pynvml.nvmlInit()
+        except Exception:
+            return None
+        try:
+            return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except Exception:
+            pynvml.nvmlShutdown()
+            return None
+    
+    def get_complete_system_info(self, force_refresh: bool = False) -> SystemInfo:
+        """Collect complete static system information
+        
+        After the first call only the fields that change at runtime (uptime,
+        last update, disk usage) are collected again, unless force_refresh.
+        The result is also emitted as info_collected, so a caller running
+        this on a worker thread can receive it through the signal.
+        """
+        info = self._collect_system_info(force_refresh)
+        self.info_collected.emit(info)
+        return info
+    
+    def _collect_system_info(self, force_refresh: bool) -> SystemInfo:
+        """Collect the SystemInfo returned by get_complete_system_info"""
+        if self._cached_info is not None and not force_refresh:
+            try:
+                last_update_date, last_update_package = self.get_last_windows_update()
+                return replace(
+                    self._cached_info,
+                    system_uptime=self.get_system_uptime(),
+                    last_update_date=last_update_date,
+                    last_update_package=last_update_package,
+                    disk_info=self.get_disk_info(),
+                )
+            except Exception as e:
+                self.error_occurred.emit(f"Error collecting system info: {str(e)}")
+                return self._cached_info
+        
         try:
             info = SystemInfo()
             
-            # Windows Information
-            info.windows_version = self.get_windows_version()
-            info.windows_build = self.get_windows_build()
-            info.windows_edition = self.get_windows_edition()
-            info.last_update_date, info.last_update_package = self.get_last_windows_update()
-            
-            # System Information
-            info.computer_name = platform.node()
-            info.user_name = os.getenv('USERNAME', 'Unknown')
-            info.system_uptime = self.get_system_uptime()
-            info.motherboard = self.get_motherboard_info()
-            info.bios_version = self.get_bios_info()
-            
-            # Hardware Information
-            info.cpu_model = self.get_cpu_model()
-            info.cpu_cores = psutil.cpu_count(logical=False) or 0
-            info.cpu_threads = psutil.cpu_count(logical=True) or 0
-            info.total_ram_gb = psutil.virtual_memory().total / (1024**3)
-            info.gpu_info = self.get_gpu_info()
-            info.nvidia_driver_version = self.get_nvidia_driver_version()
-            
-            # Disk Information
-            info.disk_info = self.get_disk_info()
+            # The collectors are independent and mostly wait on other
+            # processes, so the slow ones run side by side
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                last_update = executor.submit(self.get_last_windows_update)
+                nvidia_driver = executor.submit(self.get_nvidia_driver_version)
+                disk_info = executor.submit(self.get_disk_info)
+                
+                # WMI fields in-process over one connection, kept on this
+                # thread; otherwise one wmic process per field, all at once
+                wmi_ok = False
+                if win32com is not None:
+                    try:
+                        self._get_static_info_wmi(info)
+                        wmi_ok = True
+                    except Exception:
+                        pass
+                
+                if not wmi_ok:
+                    fallbacks = {
+                        'windows_version': self.get_windows_version,
+                        'windows_build': self.get_windows_build,
+                        'windows_edition': self.get_windows_edition,
+                        'motherboard': self.get_motherboard_info,
+                        'bios_version': self.get_bios_info,
+                        'cpu_model': self.get_cpu_model,
+                        'gpu_info': self.get_gpu_info,
+                    }
+                    futures = {field: executor.submit(getter) for field, getter in fallbacks.items()}
+                    for field, future in futures.items():
+                        setattr(info, field, future.result())
+                
+                # Windows Information
+                info.last_update_date, info.last_update_package = last_update.result()
+                
+                # System Information
+                info.computer_name = platform.node()
+                info.user_name = os.getenv('USERNAME', 'Unknown')
+                info.system_uptime = self.get_system_uptime()
+                
+                # Hardware Information
+                info.cpu_cores = psutil.cpu_count(logical=False) or 0
+                info.cpu_threads = psutil.cpu_count(logical=True) or 0
+                info.total_ram_gb = psutil.virtual_memory().total / (1024**3)
+                info.nvidia_driver_version = nvidia_driver.result()
+                
+                # Disk Information
+                info.disk_info = disk_info.result()
             
+            self._cached_info = info
             return info
             
         except Exception as e:
             self.error_occurred.emit(f"Error collecting system info: {str(e)}")
             return SystemInfo()
     
-    def get_real_time_metrics(self) -> SystemMetrics:
-        """Collect real-time system metrics"""
+    def get_real_time_metrics(self, previous: Optional[MetricsCounters] = None) -> SystemMetrics:
+        """Collect real-time system metrics without blocking
+        
+        CPU usage, disk activity and network rates are averaged since the
+        previous sample's counters, which each caller keeps for itself;
+        without them they are left at zero.
+        """
         try:
             metrics = SystemMetrics(timestamp=datetime.now())
+            metrics.counters = read_metrics_counters()
             
-            # CPU Usage
-            metrics.cpu_usage = psutil.cpu_percent(interval=1)
+            # CPU Usage; the caller's sampling interval is the measurement
+            # window, so nothing blocks here
+            if previous is not None:
+                metrics.cpu_usage = compute_cpu_usage(previous, metrics.counters)
             
             # RAM Usage
             ram = psutil.virtual_memory()
@@ -129,20 +351,32 @@ class SystemInfoManager(QObject):
             metrics.ram_available_gb = ram.available / (1024**3)
             
             # GPU Usage (NVIDIA only)
-            gpu_usage, gpu_memory = self.get_gpu_usage()
-            metrics.gpu_usage = gpu_usage
-            metrics.gpu_memory_usage = gpu_memory
+            if self.gpu_available is not False:
+                gpu_usage, gpu_memory = self.get_gpu_usage()
+                metrics.gpu_usage = gpu_usage
+                metrics.gpu_memory_usage = gpu_memory
+            metrics.gpu_available = self.gpu_available is not False
             
             # Disk Usage
             metrics.disk_usage = self.get_disk_usage()
+            metrics.disk_color_bucket = {
+                drive: disk_color_bucket(usage) for drive, usage in metrics.disk_usage.items()
+            }
+            
+            # Disk Activity
+            if previous is not None:
+                metrics.disk_read_mb, metrics.disk_write_mb = compute_disk_activity(previous, metrics.counters)
             
             # Network Activity
-            net_sent, net_recv = self.get_network_activity()
-            metrics.network_sent_mb = net_sent
-            metrics.network_recv_mb = net_recv
+            if previous is not None:
+                metrics.network_sent_mb, metrics.network_recv_mb = compute_network_rate(previous, metrics.counters)
             
             # Temperature
-            metrics.temperature_cpu = self.get_cpu_temperature()
+            if self.temperature_available is not False:
+                metrics.temperature_cpu = self.get_cpu_temperature()
+                if self.temperature_available is None:
+                    self.temperature_available = metrics.temperature_cpu is not None
+            metrics.temperature_available = self.temperature_available is not False
             
             return metrics
             
@@ -150,17 +384,70 @@ class SystemInfoManager(QObject):
             self.error_occurred.emit(f"Error collecting metrics: {str(e)}")
             return SystemMetrics(timestamp=datetime.now())
     
+    def _get_wmi(self, namespace: str = "root\\cimv2"):
+        """Get this thread's WMI connection to a namespace"""
+        connections = getattr(self._wmi_local, 'connections', None)
+        if connections is None:
+            pythoncom.CoInitialize()
+            connections = self._wmi_local.connections = {}
+        connection = connections.get(namespace)
+        if connection is None:
+            connection = win32com.client.GetObject(f"winmgmts:\\\\.\\{namespace}")
+            connections[namespace] = connection
+        return connection
+    
+    def _get_static_info_wmi(self, info: SystemInfo):
+        """Fill the OS, board, BIOS, CPU and GPU fields with in-process WMI queries"""
+        wmi = self._get_wmi()
+        
+        for os_ in wmi.ExecQuery("SELECT Caption, BuildNumber, OperatingSystemSKU FROM Win32_OperatingSystem"):
+            info.windows_version = (os_.Caption or '').strip() or platform.system() + " " + platform.release()
+            info.windows_build = (os_.BuildNumber or '').strip() or platform.version()
+            sku = str(os_.OperatingSystemSKU)
+            info.windows_edition = SKU_EDITIONS.get(sku, f"Edition {sku}")
+            break
+        
+        for board in wmi.ExecQuery("SELECT Manufacturer, Product FROM Win32_BaseBoard"):
+            info.motherboard = " ".join(
+                part.strip() for part in (board.Manufacturer, board.Product) if part and part.strip()
+            ) or "Unknown"
+            break
+        
+        for bios in wmi.ExecQuery("SELECT Manufacturer, SMBIOSBIOSVersion FROM Win32_BIOS"):
+            manufacturer = (bios.Manufacturer or '').strip()
+            version = (bios.SMBIOSBIOSVersion or '').strip()
+            if manufacturer and version:
+                info.bios_version = f"{manufacturer} {version}"
+            else:
+                info.bios_version = version or "Unknown"
+            break
+        
+        for cpu in wmi.ExecQuery("SELECT Name FROM Win32_Processor"):
+            info.cpu_model = (cpu.Name or '').strip() or "Unknown CPU"
+            break
+        
+        gpu_list = []
+        for controller in wmi.ExecQuery("SELECT Name FROM Win32_VideoController"):
+            gpu_name = (controller.Name or '').strip()
+            if gpu_name and gpu_name not in gpu_list:
+                gpu_list.append(gpu_name)
+        info.gpu_info = gpu_list if gpu_list else ["Unknown GPU"]
+    
+    @staticmethod
+    def _query_wmic(arguments: List[str], timeout: int = 10) -> Dict[str, str]:
+        """Run wmic with /value output and parse it into a key -> value dict"""
+        result = subprocess.run(
+            ['wmic'] + arguments + ['/value'],
+            capture_output=True, text=True, timeout=timeout
+        )
+        return parse_wmic_values(result.stdout)
+    
     def get_windows_version(self) -> str:
         """Get Windows version information"""
         try:
-            result = subprocess.run(
-                ['wmic', 'os', 'get', 'Caption', '/value'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            for line in result.stdout.split('\n'):
-                if 'Caption=' in line:
-                    return line.split('=', 1)[1].strip()
+            values = self._query_wmic(['os', 'get', 'Caption'])
+            if 'Caption' in values:
+                return values['Caption']
             
             return platform.system() + " " + platform.release()
             
@@ -170,14 +457,9 @@ class SystemInfoManager(QObject):
     def get_windows_build(self) -> str:
         """Get Windows build number"""
         try:
-            result = subprocess.run(
-                ['wmic', 'os', 'get', 'BuildNumber', '/value'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            for line in result.stdout.split('\n'):
-                if 'BuildNumber=' in line:
-                    return line.split('=', 1)[1].strip()
+            values = self._query_wmic(['os', 'get', 'BuildNumber'])
+            if 'BuildNumber' in values:
+                return values['BuildNumber']
             
             return platform.version()
             
@@ -187,23 +469,10 @@ class SystemInfoManager(QObject):
     def get_windows_edition(self) -> str:
         """Get Windows edition"""
         try:
-            result = subprocess.run(
-                ['wmic', 'os', 'get', 'OperatingSystemSKU', '/value'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            # Map SKU numbers to edition names
-            sku_map = {
-                '1': 'Ultimate', '2': 'Home Basic', '3': 'Home Premium',
-                '4': 'Enterprise', '6': 'Business', '7': 'Server Standard',
-                '48': 'Professional', '49': 'Enterprise N', '50': 'Enterprise KN',
-                '101': 'Home', '100': 'Home N', '103': 'Professional N'
-            }
-            
-            for line in result.stdout.split('\n'):
-                if 'OperatingSystemSKU=' in line:
-                    sku = line.split('=', 1)[1].strip()
-                    return sku_map.get(sku, f"Edition {sku}")
+            values = self._query_wmic(['os', 'get', 'OperatingSystemSKU'])
+            if 'OperatingSystemSKU' in values:
+                sku = values['OperatingSystemSKU']
+                return SKU_EDITIONS.get(sku, f"Edition {sku}")
             
             return "Unknown Edition"
             
@@ -212,21 +481,37 @@ class SystemInfoManager(QObject):
     
     def get_last_windows_update(self) -> Tuple[str, str]:
         """Get information about the last Windows update"""
+        # Read the event log in-process when possible; no shell is started
+        if win32evtlog is not None:
+            try:
+                last_update = self._get_last_update_evtlog()
+                if last_update is not None:
+                    return last_update
+            except Exception:
+                pass
+        
         try:
-            # Use PowerShell to get Windows Update history
+            # One PowerShell call: the newest update-installed event (ID 43),
+            # or the newest hotfix if the event log has none
             ps_command = """
-            Get-WinEvent -FilterHashtable @{LogName='System'; ID=43} -MaxEvents 1 | 
-            Select-Object TimeCreated, Message | 
-            ConvertTo-Json
+            $event = Get-WinEvent -FilterHashtable @{LogName='System'; ID=43} -MaxEvents 1 -ErrorAction SilentlyContinue
+            if ($event) {
+                [PSCustomObject]@{ TimeCreated = $event.TimeCreated.ToString('yyyy-MM-dd HH:mm:ss'); Message = $event.Message } | ConvertTo-Json
+            } else {
+                $hotfix = Get-HotFix | Where-Object InstalledOn | Sort-Object InstalledOn | Select-Object -Last 1
+                if ($hotfix) {
+                    [PSCustomObject]@{ TimeCreated = $hotfix.InstalledOn.ToString('yyyy-MM-dd HH:mm:ss'); Message = $hotfix.HotFixID } | ConvertTo-Json
+                }
+            }
             """
             
             result = subprocess.run(
-                ['powershell', '-Command', ps_command],
+                ['powershell', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass',
+                 '-Command', ps_command],
                 capture_output=True, text=True, timeout=30
             )
             
             if result.returncode == 0 and result.stdout.strip():
-                import json
                 try:
                     data = json.loads(result.stdout)
                     if isinstance(data, list) and data:
@@ -236,38 +521,53 @@ class SystemInfoManager(QObject):
                     message = data.get('Message', 'Unknown')
                     
                     # Extract KB number from message if available
-                    import re
-                    kb_match = re.search(r'KB\d+', message)
+                    kb_match = _KB_RE.search(message)
                     kb_number = kb_match.group() if kb_match else "Unknown Package"
                     
                     return time_created, kb_number
                 except json.JSONDecodeError:
                     pass
             
-            # Fallback method using wmic
-            result = subprocess.run(
-                ['wmic', 'qfe', 'get', 'InstalledOn,HotFixID', '/format:csv'],
-                capture_output=True, text=True, timeout=20
-            )
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) > 2:  # Skip header lines
-                    last_line = lines[-1]
-                    parts = last_line.split(',')
-                    if len(parts) >= 3:
-                        return parts[1], parts[2]
-            
             return "Unknown", "Unknown"
             
         except Exception as e:
             return f"Error: {str(e)}", "Unknown"
     
+    def _get_last_update_evtlog(self) -> Optional[Tuple[str, str]]:
+        """Read the newest update-installed event (ID 43) from the System log, or None"""
+        query = win32evtlog.EvtQuery(
+            "System", win32evtlog.EvtQueryChannelPath | win32evtlog.EvtQueryReverseDirection,
+            "*[System[(EventID=43)]]"
+        )
+        events = win32evtlog.EvtNext(query, 1)
+        if not events:
+            return None
+        
+        root = ET.fromstring(win32evtlog.EvtRender(events[0], win32evtlog.EvtRenderEventXml))
+        namespace = {'e': 'http://schemas.microsoft.com/win/2004/08/events/event'}
+        
+        time_created = "Unknown"
+        time_node = root.find('e:System/e:TimeCreated', namespace)
+        if time_node is not None and time_node.get('SystemTime'):
+            # SystemTime is UTC, e.g. 2024-01-15T10:23:45.1234567Z
+            utc_time = datetime.strptime(time_node.get('SystemTime')[:19], '%Y-%m-%dT%H:%M:%S')
+            time_created = utc_time.replace(tzinfo=timezone.utc).astimezone().strftime('%Y-%m-%d %H:%M:%S')
+        
+        # The update title in the event data carries the KB number
+        event_data = " ".join(node.text or '' for node in root.iterfind('e:EventData/e:Data', namespace))
+        kb_match = _KB_RE.search(event_data)
+        kb_number = kb_match.group() if kb_match else "Unknown Package"
+        
+        return time_created, kb_number
+    
     def get_system_uptime(self) -> str:
         """Get system uptime"""
         try:
-            boot_time = psutil.boot_time()
-            uptime_seconds = time.time() - boot_time
+            if _kernel32 is not None:
+                # Milliseconds since boot in one call, unaffected by clock changes
+                uptime_seconds = _kernel32.GetTickCount64() / 1000.0
+            else:
+                uptime_seconds = time.time() - psutil.boot_time()
             return format_uptime(uptime_seconds)
         except Exception:
             return "Unknown"
@@ -275,19 +575,9 @@ class SystemInfoManager(QObject):
     def get_motherboard_info(self) -> str:
         """Get motherboard information"""
         try:
-            result = subprocess.run(
-                ['wmic', 'baseboard', 'get', 'Manufacturer,Product', '/value'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            manufacturer = ""
-            product = ""
-            
-            for line in result.stdout.split('\n'):
-                if 'Manufacturer=' in line:
-                    manufacturer = line.split('=', 1)[1].strip()
-                elif 'Product=' in line:
-                    product = line.split('=', 1)[1].strip()
+            values = self._query_wmic(['baseboard', 'get', 'Manufacturer,Product'])
+            manufacturer = values.get('Manufacturer', '')
+            product = values.get('Product', '')
             
             if manufacturer and product:
                 return f"{manufacturer} {product}"
@@ -304,19 +594,9 @@ class SystemInfoManager(QObject):
     def get_bios_info(self) -> str:
         """Get BIOS information"""
         try:
-            result = subprocess.run(
-                ['wmic', 'bios', 'get', 'Manufacturer,SMBIOSBIOSVersion', '/value'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            manufacturer = ""
-            version = ""
-            
-            for line in result.stdout.split('\n'):
-                if 'Manufacturer=' in line:
-                    manufacturer = line.split('=', 1)[1].strip()
-                elif 'SMBIOSBIOSVersion=' in line:
-                    version = line.split('=', 1)[1].strip()
+            values = self._query_wmic(['bios', 'get', 'Manufacturer,SMBIOSBIOSVersion'])
+            manufacturer = values.get('Manufacturer', '')
+            version = values.get('SMBIOSBIOSVersion', '')
             
             if manufacturer and version:
                 return f"{manufacturer} {version}"
@@ -331,14 +611,9 @@ class SystemInfoManager(QObject):
     def get_cpu_model(self) -> str:
         """Get CPU model information"""
         try:
-            result = subprocess.run(
-                ['wmic', 'cpu', 'get', 'Name', '/value'],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            for line in result.stdout.split('\n'):
-                if 'Name=' in line:
-                    return line.split('=', 1)[1].strip()
+            values = self._query_wmic(['cpu', 'get', 'Name'])
+            if 'Name' in values:
+                return values['Name']
             
             return "Unknown CPU"
             
@@ -348,17 +623,18 @@ class SystemInfoManager(QObject):
     def get_gpu_info(self) -> List[str]:
         """Get graphics card information"""
         try:
+            # One Name= line per controller, so this output is not a single dict
             result = subprocess.run(
                 ['wmic', 'path', 'win32_VideoController', 'get', 'Name', '/value'],
                 capture_output=True, text=True, timeout=15
             )
             
             gpu_list = []
-            for line in result.stdout.split('\n'):
-                if 'Name=' in line:
-                    gpu_name = line.split('=', 1)[1].strip()
-                    if gpu_name and gpu_name not in gpu_list:
-                        gpu_list.append(gpu_name)
+            for line in result.stdout.splitlines():
+                key, _, gpu_name = line.partition('=')
+                gpu_name = gpu_name.strip()
+                if key.strip() == 'Name' and gpu_name and gpu_name not in gpu_list:
+                    gpu_list.append(gpu_name)
             
             return gpu_list if gpu_list else ["Unknown GPU"]
             
@@ -367,6 +643,15 @@ class SystemInfoManager(QObject):
     
     def get_nvidia_driver_version(self) -> str:
         """Get NVIDIA driver version"""
+        if self._nvml_handle is not None:
+            try:
+                version = pynvml.nvmlSystemGetDriverVersion()
+                if isinstance(version, bytes):  # older bindings return bytes
+                    version = version.decode()
+                return version or "Not Available"
+            except Exception:
+                pass
+        
         try:
             result = subprocess.run(
                 ['nvidia-smi', '--query-gpu=driver_version', '--format=csv,noheader,nounits'],
@@ -382,14 +667,24 @@ class SystemInfoManager(QObject):
         except Exception:
             return "Not Available"
     
-    def get_disk_info(self) -> List[Dict]:
-        """Get disk information for all drives"""
+    def _get_partitions(self):
+        """Get the partition list, enumerated at most once per PARTITIONS_TTL"""
+        now = time.monotonic()
+        if self._partitions_cache is None or now - self._partitions_time >= self.PARTITIONS_TTL:
+            self._partitions_cache = psutil.disk_partitions()
+            self._partitions_time = now
+        return self._partitions_cache
+    
+    def get_disks(self) -> Tuple[List[Dict], Dict[str, float]]:
+        """Get disk information and drive -> usage percent in one pass over the drives"""
         try:
             disk_info = []
+            disk_usage = {}
             
-            for partition in psutil.disk_partitions():
+            for partition in self._get_partitions():
                 try:
                     usage = psutil.disk_usage(partition.mountpoint)
+                    percent_used = (usage.used / usage.total) * 100
                     
                     disk_info.append({
                         'device': partition.device,
@@ -398,90 +693,78 @@ class SystemInfoManager(QObject):
                         'total_gb': usage.total / (1024**3),
                         'used_gb': usage.used / (1024**3),
                         'free_gb': usage.free / (1024**3),
-                        'percent_used': (usage.used / usage.total) * 100
+                        'percent_used': percent_used
                     })
+                    disk_usage[partition.device.replace('\\', '')] = percent_used
                     
-                except (PermissionError, OSError):
+                except (PermissionError, OSError, ZeroDivisionError):
                     # Skip drives that can't be accessed
                     continue
             
-            return disk_info
+            return disk_info, disk_usage
             
         except Exception:
-            return []
+            return [], {}
+    
+    def get_disk_info(self) -> List[Dict]:
+        """Get disk information for all drives"""
+        return self.get_disks()[0]
     
     def get_gpu_usage(self) -> Tuple[float, float]:
         """Get GPU usage and memory usage (NVIDIA only)"""
+        if self._nvml_handle is not None:
+            try:
+                utilization = pynvml.nvmlDeviceGetUtilizationRates(self._nvml_handle)
+                self.gpu_available = True
+                return float(utilization.gpu), float(utilization.memory)
+            except Exception:
+                pass
+        
         try:
-            result = subprocess.run(
-                ['nvidia-smi', '--query-gpu=utilization.gpu,utilization.memory', 
-                 '--format=csv,noheader,nounits'],
-                capture_output=True, text=True, timeout=5
-            )
-            
-            if result.returncode == 0:
-                values = result.stdout.strip().split(', ')
-                if len(values) >= 2:
-                    gpu_usage = float(values[0])
-                    memory_usage = float(values[1])
-                    return gpu_usage, memory_usage
-            
+            if self._nvsmi_stream is None or not self._nvsmi_stream.is_alive():
+                if self._nvsmi_stream is not None:
+                    self._nvsmi_stream.close()
+                self._nvsmi_stream = NvidiaSmiStream()
+            
+            reading = self._nvsmi_stream.read()
+            if reading is not None:
+                self.gpu_available = True
+                return reading
+            
+            if self.gpu_available is None:
+                self.gpu_available = False
             return 0.0, 0.0
             
         except Exception:
+            if self.gpu_available is None:
+                self.gpu_available = False
             return 0.0, 0.0
     
     def get_disk_usage(self) -> Dict[str, float]:
-        """Get current disk usage for all drives"""
-        try:
-            disk_usage = {}
-            
-            for partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    drive_letter = partition.device.replace('\\', '')
-                    disk_usage[drive_letter] = (usage.used / usage.total) * 100
-                    
-                except (PermissionError, OSError):
-                    continue
-            
-            return disk_usage
-            
-        except Exception:
-            return {}
-    
-    def get_network_activity(self) -> Tuple[float, float]:
-        """Get network send/receive rates in MB/s"""
-        try:
-            current_stats = psutil.net_io_counters()
-            current_time = time.time()
-            
-            if self.last_network_stats and self.last_network_time:
-                time_delta = current_time - self.last_network_time
-                
-                if time_delta > 0:
-                    sent_delta = current_stats.bytes_sent - self.last_network_stats.bytes_sent
-                    recv_delta = current_stats.bytes_recv - self.last_network_stats.bytes_recv
-                    
-                    sent_rate = (sent_delta / time_delta) / (1024 * 1024)  # MB/s
-                    recv_rate = (recv_delta / time_delta) / (1024 * 1024)  # MB/s
-                    
-                    self.last_network_stats = current_stats
-                    self.last_network_time = current_time
-                    
-                    return max(0, sent_rate), max(0, recv_rate)
-            
-            # First call or error - store current stats
-            self.last_network_stats = current_stats
-            self.last_network_time = current_time
-            
-            return 0.0, 0.0
-            
-        except Exception:
-            return 0.0, 0.0
+        """Get current disk usage for all drives, re-read at most once per DISK_USAGE_TTL
+        
+        The returned dict may be shared between calls and must not be modified.
+        """
+        now = time.monotonic()
+        if self._disk_usage_cache is not None and now - self._disk_usage_cache[1] < self.DISK_USAGE_TTL:
+            return self._disk_usage_cache[0]
+        
+        disk_usage = self.get_disks()[1]
+        self._disk_usage_cache = (disk_usage, now)
+        return disk_usage
     
     def get_cpu_temperature(self) -> Optional[float]:
-        """Get CPU temperature (if available)"""
+        """Get CPU temperature (if available), re-read at most once per TEMPERATURE_TTL"""
+        now = time.monotonic()
+        if self._temperature_cache is not None and now - self._temperature_cache[0] < self.TEMPERATURE_TTL:
+            return self._temperature_cache[1]
+        
+        temperature = self._read_cpu_temperature()
+        self._temperature_cache = (now, temperature)
+        return temperature
+    
+    def _read_cpu_temperature(self) -> Optional[float]:
+        """Read the CPU temperature from psutil sensors or the ACPI thermal zone"""
         try:
             # Try to get temperature from psutil (Linux/some Windows systems)
             if hasattr(psutil, 'sensors_temperatures'):
@@ -494,19 +777,22 @@ class SystemInfoManager(QObject):
                             if entry.current:
                                 return entry.current
             
-            # Windows-specific temperature reading (requires admin rights)
+            # Windows-specific temperature reading (requires admin rights),
+            # in-process over WMI when available, otherwise through wmic
             try:
-                result = subprocess.run(
-                    ['wmic', '/namespace:\\\\root\\wmi', 'PATH', 'MSAcpi_ThermalZoneTemperature', 
-                     'get', 'CurrentTemperature', '/value'],
-                    capture_output=True, text=True, timeout=5
-                )
+                if win32com is not None:
+                    for zone in self._get_wmi("root\\wmi").ExecQuery(
+                            "SELECT CurrentTemperature FROM MSAcpi_ThermalZoneTemperature"):
+                        return (int(zone.CurrentTemperature) / 10) - 273.15
+                    return None
                 
-                for line in result.stdout.split('\n'):
-                    if 'CurrentTemperature=' in line:
-                        temp_kelvin = int(line.split('=')[1].strip())
-                        temp_celsius = (temp_kelvin / 10) - 273.15
-                        return temp_celsius
+                values = self._query_wmic(
+                    ['/namespace:\\\\root\\wmi', 'PATH', 'MSAcpi_ThermalZoneTemperature',
+                     'get', 'CurrentTemperature'], timeout=5
+                )
+                if 'CurrentTemperature' in values:
+                    temp_kelvin = int(values['CurrentTemperature'])
+                    return (temp_kelvin / 10) - 273.15
                         
             except Exception:
                 pass
@@ -526,45 +812,184 @@ class SystemMonitorThread(QThread):
         super().__init__()
         self.system_info_manager = system_info_manager
         self.running = True
+        # Set while the monitor panel is hidden; no samples are taken meanwhile
+        self.paused = False
         self.update_interval = 2  # seconds
+        # Seconds between reading a fresh baseline and the first sample after it
+        self.baseline_window = 0.5
     
     def run(self):
         """Main monitoring loop"""
+        # Counters at the previous sample; rates are measured across the
+        # wait between two samples
+        counters = None
         while self.running:
+            if self.paused:
+                # Re-baseline on resume rather than averaging over the pause
+                counters = None
+                self.msleep(100)
+                continue
+            
             try:
-                metrics = self.system_info_manager.get_real_time_metrics()
+                if counters is None:
+                    # First sample (or first after a pause) gets a short window
+                    counters = read_metrics_counters()
+                    self._wait(self.baseline_window)
+                    continue
+                
+                metrics = self.system_info_manager.get_real_time_metrics(counters)
+                counters = metrics.counters
                 self.metrics_updated.emit(metrics)
                 
-                # Sleep for update interval
-                for _ in range(self.update_interval * 10):  # Check every 0.1 seconds
-                    if not self.running:
-                        break
-                    self.msleep(100)
+                # Sleep for update interval; a pause ends the wait so the
+                # thread re-baselines as soon as it resumes
+                self._wait(self.update_interval)
                     
             except Exception as e:
                 self.error_occurred.emit(f"Monitoring error: {str(e)}")
                 self.msleep(1000)  # Wait 1 second before retrying
     
+    def _wait(self, seconds: float):
+        """Sleep in 0.1 second steps, ending early on stop() or pause()"""
+        for _ in range(int(seconds * 10)):
+            if not self.running or self.paused:
+                break
+            self.msleep(100)
+    
+    def pause(self):
+        """Stop sampling until resume() is called"""
+        self.paused = True
+    
+    def resume(self):
+        """Continue sampling after pause()"""
+        self.paused = False
+    
     def stop(self):
         """Stop the monitoring thread"""
         self.running = False
         self.wait(3000)  # Wait up to 3 seconds for thread to finish
 
+class SystemInfoWorker(QThread):
+    """Thread for collecting the static system information once
+    
+    The result is delivered through the manager's info_collected signal.
+    """
+    
+    def __init__(self, system_info_manager: SystemInfoManager):
+        super().__init__()
+        self.system_info_manager = system_info_manager
+    
+    def run(self):
+        self.system_info_manager.get_complete_system_info()
+
+class MetricsWorker(QThread):
+    """Thread for taking a single real-time metrics sample
+    
+    Rates are measured since the caller's previous counters; the sample
+    carries the counters to pass in next time.
+    """
+    
+    finished_with_metrics = Signal(SystemMetrics)
+    error_occurred = Signal(str)
+    
+    def __init__(self, system_info_manager: SystemInfoManager, previous: Optional[MetricsCounters] = None):
+        super().__init__()
+        self.system_info_manager = system_info_manager
+        self.previous = previous
+    
+    def run(self):
+        try:
+            self.finished_with_metrics.emit(self.system_info_manager.get_real_time_metrics(self.previous))
+        except Exception as e:
+            self.error_occurred.emit(f"Error during manual refresh: {str(e)}")
+
 # Utility functions
+def parse_wmic_values(text: str) -> Dict[str, str]:
+    """Parse wmic /value output (Key=Value lines) into a dict; the first value of a key wins"""
+    values = {}
+    for line in text.splitlines():
+        key, separator, value = line.partition('=')
+        if separator:
+            values.setdefault(key.strip(), value.strip())
+    return values
+
+def read_metrics_counters() -> MetricsCounters:
+    """Read the counters real-time rates are computed from"""
+    try:
+        disk_io = psutil.disk_io_counters(perdisk=True) or {}
+    except Exception:
+        disk_io = {}
+    try:
+        net_io = psutil.net_io_counters()
+    except Exception:
+        net_io = None
+    return MetricsCounters(cpu_times=psutil.cpu_times(), disk_io=disk_io, net_io=net_io,
+                           time=time.monotonic())
+
+def compute_cpu_usage(start: MetricsCounters, end: MetricsCounters) -> float:
+    """CPU usage in percent between two read_metrics_counters() results
+    
+    Uses cpu_times() deltas rather than psutil.cpu_percent(), whose single
+    global baseline every caller would shorten for the others.
+    """
+    total = sum(end.cpu_times) - sum(start.cpu_times)
+    if total <= 0:
+        return 0.0
+    busy = total - (end.cpu_times.idle - start.cpu_times.idle)
+    return min(100.0, max(0.0, busy / total * 100))
+
+def compute_disk_activity(start: MetricsCounters, end: MetricsCounters) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Per-disk read and write rates in MB/s between two read_metrics_counters() results
+    
+    One counter read covers every disk, unlike a per-volume usage query.
+    """
+    time_delta = end.time - start.time
+    read_rates = {}
+    write_rates = {}
+    if time_delta <= 0:
+        return read_rates, write_rates
+    
+    for disk, counters in end.disk_io.items():
+        before = start.disk_io.get(disk)
+        if before is None:
+            continue
+        # Counters can reset; report no activity then
+        read_rates[disk] = (max(0, counters.read_bytes - before.read_bytes) / time_delta) / (1024 * 1024)
+        write_rates[disk] = (max(0, counters.write_bytes - before.write_bytes) / time_delta) / (1024 * 1024)
+    return read_rates, write_rates
+
+def compute_network_rate(start: MetricsCounters, end: MetricsCounters) -> Tuple[float, float]:
+    """Send/receive rates in MB/s between two read_metrics_counters() results"""
+    time_delta = end.time - start.time
+    if time_delta <= 0 or start.net_io is None or end.net_io is None:
+        return 0.0, 0.0
+    
+    # Counters can wrap or reset (adapter restart); report no traffic then
+    sent_delta = max(0, end.net_io.bytes_sent - start.net_io.bytes_sent)
+    recv_delta = max(0, end.net_io.bytes_recv - start.net_io.bytes_recv)
+    return (sent_delta / time_delta) / (1024 * 1024), (recv_delta / time_delta) / (1024 * 1024)
+
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_bytes(bytes_value: int) -> str:
     """Format bytes into human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    # Every unit is 2**10 of the previous one, so the bit length picks it
+    unit_index = min(5, (max(1, int(bytes_value)).bit_length() - 1) // 10)
+    return f"{bytes_value / (1 << (unit_index * 10)):.1f} {BYTE_UNITS[unit_index]}"
+
+def disk_color_bucket(usage_percent: float) -> int:
+    """Classify disk usage for highlighting: 0 ok, 1 yellow, 2 red"""
+    if usage_percent > 90:
+        return 2
+    elif usage_percent > 80:
+        return 1
+    return 0
 
 def format_uptime(seconds: float) -> str:
     """Format uptime seconds into human readable format"""
     try:
-        uptime_delta = timedelta(seconds=int(seconds))
-        days = uptime_delta.days
-        hours, remainder = divmod(uptime_delta.seconds, 3600)
+        days, remainder = divmod(int(seconds), 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, _ = divmod(remainder, 60)
         
         if days > 0:
@@ -0,0 +1,90 @@
+"""
+Tests for the native (pywin32) service enumeration in ServicesManager
+"""
+
+from unittest import mock
+
+import pytest
+
+import services_manager
+from services_manager import ServicesManager, ServiceStartType, ServiceStatus
+
+
+class FakeWin32Service:
+    """Stand-in for pywin32's win32service with the signatures the manager uses"""
+    
+    SERVICE_WIN32 = 0x30
+    SERVICE_STATE_ALL = 0x3
+    SC_ENUM_PROCESS_INFO = 0
+    SC_MANAGER_CONNECT = 0x1
+    SC_MANAGER_ENUMERATE_SERVICE = 0x4
+    SERVICE_QUERY_CONFIG = 0x1
+    error = OSError
+    
+    def __init__(self, entries, start_types):
+        self.entries = entries
+        self.start_types = start_types
+        self.enum_calls = []
+    
+    def OpenSCManager(self, machine, database, access):
+        return 'scm'
+    
+    def EnumServicesStatusEx(self, scm, service_type, service_state, group_name=None, info_level=0):
+        # pywin32 rejects anything but a string or None for the group name
+        if group_name is not None and not isinstance(group_name, str):
+            raise TypeError("GroupName must be a string or None")
+        self.enum_calls.append((scm, service_type, service_state, group_name, info_level))
+        return self.entries
+    
+    def OpenService(self, scm, service_name, access):
+        return service_name
+    
+    def QueryServiceConfig(self, handle):
+        return (0x10, self.start_types[handle], 1, '', '', 0, '', '', handle)
+    
+    def CloseServiceHandle(self, handle):
+        pass
+
+
+@pytest.fixture
+def fake_win32service():
+    fake = FakeWin32Service(
+        entries=[
+            {'ServiceName': 'wuauserv', 'CurrentState': 4, 'ProcessId': 1234},
+            {'ServiceName': 'BITS', 'CurrentState': 1, 'ProcessId': 0},
+            {'ServiceName': 'NotImportant', 'CurrentState': 4, 'ProcessId': 99},
+        ],
+        start_types={'wuauserv': 3, 'BITS': 2},
+    )
+    with mock.patch.object(services_manager, 'win32service', fake), \
+            mock.patch.object(services_manager, 'win32com', None):
+        yield fake
+
+
+def test_native_enumeration_passes_group_name_and_info_level(fake_win32service):
+    manager = ServicesManager()
+    
+    services = manager._get_services_native()
+    
+    assert fake_win32service.enum_calls == [(
+        'scm', FakeWin32Service.SERVICE_WIN32, FakeWin32Service.SERVICE_STATE_ALL,
+        None, FakeWin32Service.SC_ENUM_PROCESS_INFO
+    )]
+    assert set(services) == {'wuauserv', 'bits'}
+    assert services['wuauserv'].status == ServiceStatus.RUNNING
+    assert services['wuauserv'].start_type == ServiceStartType.MANUAL
+    assert services['wuauserv'].pid == 1234
+    assert services['bits'].status == ServiceStatus.STOPPED
+    assert services['bits'].start_type == ServiceStartType.AUTOMATIC
+    assert services['bits'].pid is None
+
+
+def test_all_important_services_uses_native_backend(fake_win32service):
+    manager = ServicesManager()
+    manager.subprocess_fallback = False
+    
+    with mock.patch.object(services_manager, '_log_throttled') as log_throttled:
+        services = manager.get_all_important_services()
+    
+    log_throttled.assert_not_called()
+    assert set(services) == {'wuauserv', 'bits'}
@@ -0,0 +1,62 @@
+"""
+Tests for killing processes by name in ElevatedCommandRunner
+"""
+
+from unittest import mock
+
+import psutil
+import pytest
+
+from system_commands import ElevatedCommandRunner
+
+
+class FakeProcess:
+    """Process from psutil.process_iter() that may exit or ignore terminate()"""
+    
+    def __init__(self, pid, name, error=None):
+        self.pid = pid
+        self.info = {'pid': pid, 'name': name}
+        self.error = error
+        self.terminated = False
+    
+    def terminate(self):
+        if isinstance(self.error, psutil.NoSuchProcess):
+            raise self.error
+        self.terminated = True
+    
+    def wait(self, timeout=None):
+        if isinstance(self.error, psutil.TimeoutExpired):
+            raise self.error
+
+
+@pytest.fixture(autouse=True)
+def empty_snapshot():
+    ElevatedCommandRunner._process_snapshot = None
+    yield
+    ElevatedCommandRunner._process_snapshot = None
+    ElevatedCommandRunner._process_snapshot_time = 0.0
+
+
+def test_kill_process_enumerates_afresh_and_skips_exited_processes():
+    # A cached snapshot from before the first process exited must not be used
+    ElevatedCommandRunner._process_snapshot = {'tool.exe': [FakeProcess(1, 'tool.exe')]}
+    ElevatedCommandRunner._process_snapshot_time = float('inf')
+    exited = FakeProcess(1, 'Tool.exe', psutil.NoSuchProcess(1))
+    running = FakeProcess(2, 'tool.exe')
+    other = FakeProcess(3, 'other.exe')
+    
+    with mock.patch.object(psutil, 'process_iter', return_value=[exited, running, other]):
+        assert ElevatedCommandRunner.kill_process('TOOL.EXE') is True
+    
+    assert running.terminated
+    assert not other.terminated
+
+
+def test_kill_process_reports_a_process_that_did_not_end():
+    stuck = FakeProcess(1, 'tool.exe', psutil.TimeoutExpired(5, 1))
+    running = FakeProcess(2, 'tool.exe')
+    
+    with mock.patch.object(psutil, 'process_iter', return_value=[stuck, running]):
+        assert ElevatedCommandRunner.kill_process('tool.exe') is False
+    
+    assert running.terminated
@@ -0,0 +1,82 @@
+"""
+Tests for the real-time rates computed by SystemInfoManager
+"""
+
+from collections import namedtuple
+from unittest import mock
+
+import pytest
+
+import system_info_manager
+from system_info_manager import (MetricsCounters, SystemInfoManager, compute_cpu_usage,
+                                 compute_disk_activity, compute_network_rate)
+
+
+CpuTimes = namedtuple('CpuTimes', 'user system idle')
+DiskIo = namedtuple('DiskIo', 'read_bytes write_bytes')
+NetIo = namedtuple('NetIo', 'bytes_sent bytes_recv')
+
+MB = 1024 * 1024
+
+
+def counters(busy, idle, at, disk_io=None, net_io=None):
+    return MetricsCounters(cpu_times=CpuTimes(busy, 0.0, idle), disk_io=disk_io or {}, net_io=net_io, time=at)
+
+
+@pytest.fixture
+def manager():
+    manager = SystemInfoManager()
+    manager.gpu_available = False
+    manager.temperature_available = False
+    return manager
+
+
+def test_cpu_usage_between_counters():
+    assert compute_cpu_usage(counters(10, 10, 0.0), counters(13, 11, 2.0)) == pytest.approx(75.0)
+    # No elapsed CPU time (or counters going backwards) reads as idle
+    assert compute_cpu_usage(counters(10, 10, 0.0), counters(10, 10, 2.0)) == 0.0
+
+
+def test_disk_activity_between_counters():
+    start = counters(0, 0, 0.0, {'PhysicalDrive0': DiskIo(0, 10 * MB), 'PhysicalDrive1': DiskIo(5 * MB, 0)})
+    end = counters(0, 0, 2.0, {'PhysicalDrive0': DiskIo(4 * MB, 12 * MB), 'PhysicalDrive1': DiskIo(0, 0),
+                               'PhysicalDrive2': DiskIo(MB, MB)})
+    read_rates, write_rates = compute_disk_activity(start, end)
+    
+    assert read_rates == {'PhysicalDrive0': pytest.approx(2.0), 'PhysicalDrive1': 0.0}
+    assert write_rates == {'PhysicalDrive0': pytest.approx(1.0), 'PhysicalDrive1': 0.0}
+
+
+def test_network_rate_between_counters():
+    start = counters(0, 0, 0.0, net_io=NetIo(MB, 10 * MB))
+    assert compute_network_rate(start, counters(0, 0, 0.5, net_io=NetIo(2 * MB, 11 * MB))) == (
+        pytest.approx(2.0), pytest.approx(2.0))
+    # Counters reset by an adapter restart, or unreadable, report no traffic
+    assert compute_network_rate(start, counters(0, 0, 0.5, net_io=NetIo(0, 0))) == (0.0, 0.0)
+    assert compute_network_rate(start, counters(0, 0, 0.5)) == (0.0, 0.0)
+
+
+def test_callers_keep_their_own_cpu_baseline(manager):
+    # The monitor's baseline is old, the manual refresh's is recent; a
+    # sample for one must not move the other's window
+    monitor_previous = counters(0, 100, 0.0)
+    refresh_previous = counters(50, 100, 1.0)
+    with mock.patch.object(system_info_manager, 'read_metrics_counters',
+                           return_value=counters(60, 140, 2.0)):
+        refresh = manager.get_real_time_metrics(refresh_previous)
+        monitor = manager.get_real_time_metrics(monitor_previous)
+
+    assert refresh.cpu_usage == pytest.approx(20.0)
+    assert monitor.cpu_usage == pytest.approx(60.0)
+    assert monitor.counters.time == 2.0
+
+
+def test_first_sample_without_baseline_reports_no_rates(manager):
+    with mock.patch.object(system_info_manager.time, 'sleep') as sleep:
+        metrics = manager.get_real_time_metrics()
+    
+    sleep.assert_not_called()
+    assert metrics.cpu_usage == 0.0
+    assert metrics.disk_read_mb == {}
+    assert (metrics.network_sent_mb, metrics.network_recv_mb) == (0.0, 0.0)
+    assert metrics.counters is not None
@@ -1,354 +1,43 @@
+"""
+Application stylesheet, loaded from resources/main.qss
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Optional
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_WHITESPACE_RE = re.compile(r'\s+')
+# Spaces around braces, semicolons and commas carry no meaning; a space
+# before ':' can (descendant selector), so only the one after it is dropped
+_PUNCTUATION_SPACE_RE = re.compile(r' ?([{};,]) ?|(:) ')
+
+def minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt's parser has less to tokenize"""
+    qss = _COMMENT_RE.sub('', qss)
+    qss = _WHITESPACE_RE.sub(' ', qss)
+    return _PUNCTUATION_SPACE_RE.sub(lambda match: match.group(1) or match.group(2), qss).strip()
+
 class UIStyles:
+    # Minified stylesheet text, read from disk on the first get_stylesheet() call
+    _cached: Optional[str] = None
+    
     @staticmethod
-    def get_stylesheet():
-        return """
-        /* Main Window */
-        QMainWindow {
-            background-color: #F5F5F5;
-            color: #2C3E50;
-        }
-        
-        /* Header */
-        QLabel#header {
-            font-size: 24px;
-            font-weight: bold;
-            color: #2C3E50;
-            margin: 0px 0px 20px 0px;
-            padding: 10px;
-        }
-        
-        /* Tab Widget */
-        QTabWidget {
-            background-color: white;
-            border: none;
-        }
-        
-        QTabWidget::pane {
-            border: 1px solid #BDC3C7;
-            background-color: white;
-        }
-        
-        QTabBar::tab {
-            background-color: #ECF0F1;
-            color: #2C3E50;
-            padding: 10px 15px;
-            margin-right: 2px;
-            font-weight: 600;
-            font-size: 14px;
-        }
-        
-        QTabBar::tab:selected {
-            background-color: white;
-            border-bottom: 2px solid #3498DB;
-        }
-        
-        QTabBar::tab:hover {
-            background-color: #D5DBDB;
-        }
-        
-        /* Tab Titles */
-        QLabel#tab-title {
-            font-size: 18px;
-            font-weight: 600;
-            color: #2C3E50;
-            margin: 0px 0px 10px 0px;
-        }
-        
-        /* Descriptions */
-        QLabel#description {
-            color: #7F8C8D;
-            margin: 0px 0px 20px 0px;
-            font-size: 14px;
-        }
-        
-        /* Console/Output Areas */
-        QTextEdit#console {
-            background-color: #2C3E50;
-            color: #ECF0F1;
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 12px;
-            border: 1px solid #34495E;
-            padding: 10px;
-            line-height: 1.4;
-        }
-        
-        /* Buttons */
-        QPushButton {
-            font-weight: 600;
-            font-size: 14px;
-            padding: 8px 15px;
-            border: none;
-            border-radius: 4px;
-            min-width: 120px;
-        }
-        
-        QPushButton#primary-button {
-            background-color: #3498DB;
-            color: white;
-        }
-        
-        QPushButton#primary-button:hover {
-            background-color: #2980B9;
-        }
-        
-        QPushButton#primary-button:pressed {
-            background-color: #21618C;
-        }
-        
-        QPushButton#success-button {
-            background-color: #27AE60;
-            color: white;
-        }
-        
-        QPushButton#success-button:hover {
-            background-color: #229954;
-        }
-        
-        QPushButton#success-button:pressed {
-            background-color: #1E8449;
-        }
-        
-        QPushButton#danger-button {
-            background-color: #E74C3C;
-            color: white;
-        }
-        
-        QPushButton#danger-button:hover {
-            background-color: #C0392B;
-        }
-        
-        QPushButton#danger-button:pressed {
-            background-color: #A93226;
-        }
-        
-        QPushButton#warning-button {
-            background-color: #F39C12;
-            color: white;
-        }
-        
-        QPushButton#warning-button:hover {
-            background-color: #E67E22;
-        }
-        
-        QPushButton#warning-button:pressed {
-            background-color: #D35400;
-        }
-        
-        QPushButton#info-button {
-            background-color: #16A085;
-            color: white;
-        }
-        
-        QPushButton#info-button:hover {
-            background-color: #138D75;
-        }
-        
-        QPushButton#info-button:pressed {
-            background-color: #117A65;
-        }
-        
-        QPushButton:disabled {
-            background-color: #BDC3C7;
-            color: #7F8C8D;
-        }
-        
-        /* ComboBox */
-        QComboBox {
-            padding: 5px 10px;
-            border: 1px solid #BDC3C7;
-            border-radius: 4px;
-            background-color: white;
-            min-width: 100px;
-        }
-        
-        QComboBox:hover {
-            border-color: #3498DB;
-        }
-        
-        QComboBox::drop-down {
-            border: none;
-            width: 20px;
-        }
-        
-        QComboBox::down-arrow {
-            image: none;
-            border-left: 5px solid transparent;
-            border-right: 5px solid transparent;
-            border-top: 5px solid #7F8C8D;
-            margin-right: 5px;
-        }
-        
-        /* Labels */
-        QLabel {
-            color: #2C3E50;
-        }
-        
-        /* Scrollbars */
-        QScrollBar:vertical {
-            background-color: #34495E;
-            width: 12px;
-            border-radius: 6px;
-        }
-        
-        QScrollBar::handle:vertical {
-            background-color: #7F8C8D;
-            border-radius: 6px;
-            min-height: 20px;
-        }
-        
-        QScrollBar::handle:vertical:hover {
-            background-color: #95A5A6;
-        }
-        
-        QScrollBar::add-line:vertical,
-        QScrollBar::sub-line:vertical {
-            height: 0px;
-        }
-
-        /* Network Tools Specific Styles */
-        QGroupBox {
-            font-weight: bold;
-            border: 2px solid #BDC3C7;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-            color: #2C3E50;
-        }
-
-        QTableWidget {
-            gridline-color: #BDC3C7;
-            background-color: white;
-            alternate-background-color: #F8F9FA;
-            selection-background-color: #3498DB;
-            selection-color: white;
-            font-size: 12px;
-            border: 1px solid #BDC3C7;
-        }
-
-        QTableWidget::item {
-            padding: 8px 4px;
-            border-bottom: 1px solid #ECF0F1;
-            color: #2C3E50;
-            min-height: 20px;
-        }
-
-        QTableWidget::item:selected {
-            background-color: #3498DB;
-            color: white;
-        }
-
-        QTableWidget::item:hover {
-            background-color: #EBF3FD;
-        }
-
-        QHeaderView::section {
-            background-color: #34495E;
-            color: white;
-            padding: 6px 4px;
-            border: none;
-            font-weight: bold;
-            font-size: 12px;
-            min-height: 25px;
-        }
-
-        QLineEdit {
-            padding: 5px 10px;
-            border: 1px solid #BDC3C7;
-            border-radius: 4px;
-            background-color: white;
-            font-size: 14px;
-        }
-
-        QLineEdit:focus {
-            border-color: #3498DB;
-            outline: none;
-        }
-
-        QSpinBox {
-            padding: 5px;
-            border: 1px solid #BDC3C7;
-            border-radius: 4px;
-            background-color: white;
-        }
-
-        QCheckBox {
-            spacing: 5px;
-            color: #2C3E50;
-        }
-
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-        }
-
-        QCheckBox::indicator:unchecked {
-            border: 2px solid #BDC3C7;
-            background-color: white;
-            border-radius: 3px;
-        }
-
-        QCheckBox::indicator:checked {
-            border: 2px solid #27AE60;
-            background-color: #27AE60;
-            border-radius: 3px;
-        }
-
-        QProgressBar {
-            border: 1px solid #BDC3C7;
-            border-radius: 4px;
-            text-align: center;
-            font-weight: bold;
-        }
-
-        QProgressBar::chunk {
-            background-color: #3498DB;
-            border-radius: 3px;
-        }
-
-        QLabel#status-label {
-            color: #2C3E50;
-            font-weight: bold;
-            font-size: 14px;
-            padding: 5px;
-            background-color: #ECF0F1;
-            border-radius: 4px;
-        }
-
-        QLabel#service-status-running {
-            color: #27AE60;
-            font-weight: bold;
-        }
-
-        QLabel#service-status-stopped {
-            color: #E74C3C;
-            font-weight: bold;
-        }
-
-        QLabel#service-status-pending {
-            color: #F39C12;
-            font-weight: bold;
-        }
-
-        QFrame#control-panel {
-            background-color: #F8F9FA;
-            border: 1px solid #BDC3C7;
-            border-radius: 4px;
-            padding: 8px;
-            margin-bottom: 10px;
-        }
-
-        QSplitter::handle {
-            background-color: #BDC3C7;
-            height: 3px;
-        }
-
-        QSplitter::handle:hover {
-            background-color: #3498DB;
-        }
-        """
+    def _stylesheet_path() -> Path:
+        """Path of main.qss; frozen builds ship it next to the executable"""
+        if getattr(sys, 'frozen', False):
+            base_dir = Path(sys.executable).parent
+        else:
+            base_dir = Path(__file__).parent
+        return base_dir / "resources" / "main.qss"
+    
+    @classmethod
+    def get_stylesheet(cls) -> str:
+        if cls._cached is None:
+            try:
+                cls._cached = minify_qss(cls._stylesheet_path().read_text(encoding='utf-8'))
+            except OSError as e:
+                print(f"Error loading stylesheet: {e}")
+                cls._cached = ""
+        return cls._cached